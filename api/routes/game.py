@@ -1,6 +1,8 @@
 """Game API endpoints."""
 
+import base64
 import time
+from dataclasses import asdict
 from decimal import Decimal
 from fastapi import APIRouter, HTTPException, Header
 from typing import Annotated, Any
@@ -13,7 +15,7 @@ from api.schemas import (
     CardResponse,
 )
 from api.session import get_session, update_session, create_session, get_session_store
-from core.cards import Card, Rank, Suit
+from core.cards import Card, decode_cards, encode_cards
 from core.game import BlackjackGame
 from core.hand import Hand
 from core.strategy.rules import RuleSet
@@ -30,37 +32,42 @@ SESSION_KEY_CREATED_AT = "created_at"
 SESSION_KEY_LAST_ACTIVITY = "last_activity"
 
 
-def _serialize_card(card: Card) -> dict[str, int]:
-    """Serialize a card to a dict."""
-    return {"rank": card.rank.value, "suit": card.suit.value}
+def _serialize_cards(cards: list[Card]) -> str:
+    """Serialize a card sequence to base64 text, one code byte per card."""
+    return base64.b64encode(encode_cards(cards)).decode("ascii")
 
 
-def _deserialize_card(data: dict[str, int]) -> Card:
-    """Deserialize a card from a dict."""
-    return Card(Rank(data["rank"]), Suit(data["suit"]))
+def _deserialize_cards(data: str) -> list[Card]:
+    """Deserialize a card sequence from base64 text."""
+    return decode_cards(base64.b64decode(data))
 
 
-def _serialize_hand(hand: Hand) -> dict[str, Any]:
-    """Serialize a hand to a dict."""
-    return {
-        "cards": [_serialize_card(c) for c in hand.cards],
-        "bet": hand.bet,
-        "is_doubled": hand.is_doubled,
-        "is_split_hand": hand.is_split_hand,
-        "is_surrendered": hand.is_surrendered,
-    }
+# Bit flags for the packed hand-state int
+_HAND_DOUBLED = 1
+_HAND_SPLIT = 2
+_HAND_SURRENDERED = 4
 
 
-def _deserialize_hand(data: dict[str, Any]) -> Hand:
-    """Deserialize a hand from a dict."""
-    hand = Hand(
-        cards=[_deserialize_card(c) for c in data["cards"]],
-        bet=data["bet"],
-        is_doubled=data["is_doubled"],
-        is_split_hand=data["is_split_hand"],
-        is_surrendered=data["is_surrendered"],
+def _serialize_hand(hand: Hand) -> list[Any]:
+    """Serialize a hand to a [cards, bet, flags] list."""
+    flags = (
+        (_HAND_DOUBLED if hand.is_doubled else 0)
+        | (_HAND_SPLIT if hand.is_split_hand else 0)
+        | (_HAND_SURRENDERED if hand.is_surrendered else 0)
+    )
+    return [_serialize_cards(hand.cards), hand.bet, flags]
+
+
+def _deserialize_hand(data: list[Any]) -> Hand:
+    """Deserialize a hand from a [cards, bet, flags] list."""
+    cards, bet, flags = data
+    return Hand(
+        cards=_deserialize_cards(cards),
+        bet=bet,
+        is_doubled=bool(flags & _HAND_DOUBLED),
+        is_split_hand=bool(flags & _HAND_SPLIT),
+        is_surrendered=bool(flags & _HAND_SURRENDERED),
     )
-    return hand
 
 
 def _serialize_game(game: BlackjackGame) -> dict[str, Any]:
@@ -70,47 +77,18 @@ def _serialize_game(game: BlackjackGame) -> dict[str, Any]:
         "bankroll": str(game.player.bankroll),
         "insurance_bet": str(game.player.insurance_bet),
         "current_hand_index": game.player.current_hand_index,
-        "shoe_cards": [_serialize_card(c) for c in game.shoe._cards],
+        "shoe_cards": base64.b64encode(game.shoe.card_codes).decode("ascii"),
         "shoe_num_decks": game.shoe._num_decks,
         "shoe_penetration": game.shoe._penetration,
         "player_hands": [_serialize_hand(h) for h in game.player.hands],
         "dealer_hand": _serialize_hand(game.dealer_hand),
-        "rules": {
-            "num_decks": game.rules.num_decks,
-            "min_bet": game.rules.min_bet,
-            "max_bet": game.rules.max_bet,
-            "dealer_hits_soft_17": game.rules.dealer_hits_soft_17,
-            "blackjack_payout": game.rules.blackjack_payout,
-            "double_after_split": game.rules.double_after_split,
-            "double_on": game.rules.double_on,
-            "resplit_aces": game.rules.resplit_aces,
-            "hit_split_aces": game.rules.hit_split_aces,
-            "max_splits": game.rules.max_splits,
-            "surrender": game.rules.surrender,
-            "insurance_allowed": game.rules.insurance_allowed,
-            "dealer_peeks": game.rules.dealer_peeks,
-        },
+        "rules": asdict(game.rules),
     }
 
 
 def _deserialize_game(data: dict[str, Any]) -> BlackjackGame:
     """Restore game from session data."""
-    rules_data = data["rules"]
-    rules = RuleSet(
-        num_decks=rules_data["num_decks"],
-        min_bet=rules_data["min_bet"],
-        max_bet=rules_data["max_bet"],
-        dealer_hits_soft_17=rules_data["dealer_hits_soft_17"],
-        blackjack_payout=rules_data["blackjack_payout"],
-        double_after_split=rules_data["double_after_split"],
-        double_on=rules_data["double_on"],
-        resplit_aces=rules_data["resplit_aces"],
-        hit_split_aces=rules_data["hit_split_aces"],
-        max_splits=rules_data["max_splits"],
-        surrender=rules_data["surrender"],
-        insurance_allowed=rules_data["insurance_allowed"],
-        dealer_peeks=rules_data["dealer_peeks"],
-    )
+    rules = RuleSet(**data["rules"])
 
     # Create game with restored rules
     game = BlackjackGame(
@@ -133,7 +111,7 @@ def _deserialize_game(data: dict[str, Any]) -> BlackjackGame:
     game.dealer_hand = _deserialize_hand(data["dealer_hand"])
 
     # Restore shoe cards
-    game.shoe._cards = [_deserialize_card(c) for c in data["shoe_cards"]]
+    game.shoe.restore_card_codes(base64.b64decode(data["shoe_cards"]))
 
     return game
 
@@ -143,7 +121,11 @@ async def _load_game(session_id: str) -> BlackjackGame | None:
     store = await get_session_store()
     session_data = await store.get(session_id)
     if session_data and SESSION_KEY_GAME in session_data:
-        return _deserialize_game(session_data[SESSION_KEY_GAME])
+        try:
+            return _deserialize_game(session_data[SESSION_KEY_GAME])
+        except (KeyError, TypeError, ValueError):
+            # Stored in an older or corrupt format; caller starts a new game
+            return None
     return None
 
 
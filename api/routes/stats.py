@@ -2,9 +2,10 @@
 
 import time
 from decimal import Decimal
-from typing import Annotated, Any
+from typing import Annotated, Any, overload
 
 from fastapi import APIRouter, Header
+from pydantic import TypeAdapter
 
 from api.schemas import (
     HouseEdgeRequest,
@@ -26,60 +27,47 @@ router = APIRouter()
 # Performance stats memory cache (backed by session store)
 _performance_stats: dict[str, PerformanceStats] = {}
 
+# Validates a whole stored history list in one pydantic-core call
+_HISTORY_ADAPTER = TypeAdapter(list[SessionHistoryEntry])
+
 # Session data keys
 SESSION_KEY_PERFORMANCE = "performance"
 SESSION_KEY_LAST_ACTIVITY = "last_activity"
 
 
+@overload
+def _safe_ratio(num: float, den: float) -> float | None: ...
+
+
+@overload
+def _safe_ratio(num: float, den: float, default: float) -> float: ...
+
+
+def _safe_ratio(
+    num: float, den: float, default: float | None = None
+) -> float | None:
+    """Return num / den, or default when den is zero."""
+    return num / den if den else default
+
+
 def _serialize_performance_stats(stats: PerformanceStats) -> dict[str, Any]:
     """Serialize performance stats for session storage."""
-    return {
-        "hands_played": stats.hands_played,
-        "wins": stats.wins,
-        "losses": stats.losses,
-        "pushes": stats.pushes,
-        "blackjacks": stats.blackjacks,
-        "total_wagered": stats.total_wagered,
-        "net_result": stats.net_result,
-        "count_drills_attempted": stats.count_drills_attempted,
-        "count_drills_correct": stats.count_drills_correct,
-        "count_average_error": stats.count_average_error,
-        "strategy_drills_attempted": stats.strategy_drills_attempted,
-        "strategy_drills_correct": stats.strategy_drills_correct,
-        "deviation_drills_attempted": stats.deviation_drills_attempted,
-        "deviation_drills_correct": stats.deviation_drills_correct,
-        "speed_drills_attempted": stats.speed_drills_attempted,
-        "speed_drills_correct": stats.speed_drills_correct,
-        "speed_drill_best_score": stats.speed_drill_best_score,
-        "speed_drill_best_time_ms": stats.speed_drill_best_time_ms,
-        "history": [h.model_dump() for h in stats.history],
-    }
+    # Pydantic keeps field values in __dict__, so copying it covers every
+    # field without listing them. History entries are flat models apart from
+    # details, which is copied so the stored snapshot does not share it with
+    # the live cached stats.
+    data = stats.__dict__.copy()
+    data["history"] = [
+        {**h.__dict__, "details": dict(h.details) if h.details else h.details}
+        for h in stats.history
+    ]
+    return data
 
 
 def _deserialize_performance_stats(data: dict[str, Any]) -> PerformanceStats:
     """Deserialize performance stats from session storage."""
-    history = [SessionHistoryEntry(**h) for h in data.get("history", [])]
-    return PerformanceStats(
-        hands_played=data.get("hands_played", 0),
-        wins=data.get("wins", 0),
-        losses=data.get("losses", 0),
-        pushes=data.get("pushes", 0),
-        blackjacks=data.get("blackjacks", 0),
-        total_wagered=data.get("total_wagered", 0.0),
-        net_result=data.get("net_result", 0.0),
-        count_drills_attempted=data.get("count_drills_attempted", 0),
-        count_drills_correct=data.get("count_drills_correct", 0),
-        count_average_error=data.get("count_average_error", 0.0),
-        strategy_drills_attempted=data.get("strategy_drills_attempted", 0),
-        strategy_drills_correct=data.get("strategy_drills_correct", 0),
-        deviation_drills_attempted=data.get("deviation_drills_attempted", 0),
-        deviation_drills_correct=data.get("deviation_drills_correct", 0),
-        speed_drills_attempted=data.get("speed_drills_attempted", 0),
-        speed_drills_correct=data.get("speed_drills_correct", 0),
-        speed_drill_best_score=data.get("speed_drill_best_score", 0),
-        speed_drill_best_time_ms=data.get("speed_drill_best_time_ms"),
-        history=history,
-    )
+    history = _HISTORY_ADAPTER.validate_python(data.get("history", []))
+    return PerformanceStats.model_validate({**data, "history": history})
 
 
 async def _load_performance_stats(session_id: str) -> PerformanceStats | None:
@@ -154,23 +142,17 @@ async def get_session_stats(
     """Get session statistics."""
     stats = await _get_or_create_performance_stats(session_id)
 
-    win_rate = stats.wins / stats.hands_played if stats.hands_played > 0 else 0.0
-
-    counting_accuracy = None
-    if stats.count_drills_attempted > 0:
-        counting_accuracy = stats.count_drills_correct / stats.count_drills_attempted
-
-    strategy_accuracy = None
-    if stats.strategy_drills_attempted > 0:
-        strategy_accuracy = stats.strategy_drills_correct / stats.strategy_drills_attempted
-
     return SessionStatsResponse(
         hands_played=stats.hands_played,
-        win_rate=win_rate,
+        win_rate=_safe_ratio(stats.wins, stats.hands_played, 0.0),
         total_wagered=stats.total_wagered,
         net_result=stats.net_result,
-        counting_accuracy=counting_accuracy,
-        strategy_accuracy=strategy_accuracy,
+        counting_accuracy=_safe_ratio(
+            stats.count_drills_correct, stats.count_drills_attempted
+        ),
+        strategy_accuracy=_safe_ratio(
+            stats.strategy_drills_correct, stats.strategy_drills_attempted
+        ),
     )
 
 
@@ -1,9 +1,10 @@
 """Session management with Redis backend and in-memory fallback."""
 
+import heapq
 import json
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable, cast
 from uuid import uuid4
 
 try:
@@ -13,6 +14,13 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
 
 from config import config
@@ -63,6 +71,8 @@ def get_session_signer() -> SessionSigner:
 class SessionStore(ABC):
     """Abstract session store."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get(self, session_id: str) -> dict[str, Any] | None:
         """Get session data."""
@@ -103,8 +113,22 @@ class SessionStore(ABC):
 class InMemorySessionStore(SessionStore):
     """In-memory session store for local development."""
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, tuple[dict[str, Any], datetime]] = {}
+    __slots__ = ("_clock", "_sessions", "_expiry_heap")
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            clock: Returns the current time in seconds; expiry is measured
+                against it (injectable for tests)
+        """
+        self._clock = clock
+        self._sessions: dict[str, tuple[dict[str, Any], float]] = {}
+        # (expiry, session_id) min-heap; entries left behind by overwrites or
+        # deletes are skipped in cleanup_expired, and the heap is rebuilt from
+        # the live sessions once they outnumber them (see _compact_heap)
+        self._expiry_heap: list[tuple[float, str]] = []
 
     async def get(self, session_id: str) -> dict[str, Any] | None:
         """Get session data."""
@@ -112,7 +136,7 @@ class InMemorySessionStore(SessionStore):
             return None
 
         data, expiry = self._sessions[session_id]
-        if expiry < datetime.now():
+        if expiry < self._clock():
             await self.delete(session_id)
             return None
 
@@ -126,12 +150,23 @@ class InMemorySessionStore(SessionStore):
     ) -> None:
         """Set session data."""
         ttl = ttl or config.session_ttl
-        expiry = datetime.now() + timedelta(seconds=ttl)
+        expiry = self._clock() + ttl
         self._sessions[session_id] = (data, expiry)
+        heapq.heappush(self._expiry_heap, (expiry, session_id))
+        self._compact_heap()
 
     async def delete(self, session_id: str) -> None:
         """Delete session."""
         self._sessions.pop(session_id, None)
+        self._compact_heap()
+
+    def _compact_heap(self) -> None:
+        """Rebuild the expiry heap once stale entries make up over half of it."""
+        if len(self._expiry_heap) > 2 * len(self._sessions):
+            self._expiry_heap = [
+                (expiry, sid) for sid, (_, expiry) in self._sessions.items()
+            ]
+            heapq.heapify(self._expiry_heap)
 
     async def exists(self, session_id: str) -> bool:
         """Check if session exists."""
@@ -139,13 +174,31 @@ class InMemorySessionStore(SessionStore):
 
     async def cleanup_expired(self) -> int:
         """Remove expired sessions."""
-        now = datetime.now()
-        expired = [
-            sid for sid, (_, expiry) in self._sessions.items() if expiry < now
-        ]
-        for sid in expired:
-            del self._sessions[sid]
-        return len(expired)
+        now = self._clock()
+        heap = self._expiry_heap
+        count = 0
+        while heap and heap[0][0] < now:
+            expiry, sid = heapq.heappop(heap)
+            entry = self._sessions.get(sid)
+            if entry is not None and entry[1] == expiry:
+                del self._sessions[sid]
+                count += 1
+        return count
+
+
+def _dumps(data: dict[str, Any]) -> bytes | str:
+    """Encode session data as JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces int keys to str
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data)
+
+
+def _loads(data: bytes | str) -> dict[str, Any]:
+    """Decode session data from JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return cast(dict[str, Any], orjson.loads(data))
+    return cast(dict[str, Any], json.loads(data))
 
 
 class RedisSessionStore(SessionStore):
@@ -164,7 +217,7 @@ class RedisSessionStore(SessionStore):
         data = await self._redis.get(self._key(session_id))
         if data is None:
             return None
-        return json.loads(data)
+        return _loads(data)
 
     async def set(
         self,
@@ -177,7 +230,7 @@ class RedisSessionStore(SessionStore):
         await self._redis.setex(
             self._key(session_id),
             ttl,
-            json.dumps(data),
+            _dumps(data),
         )
 
     async def delete(self, session_id: str) -> None:
@@ -1,13 +1,13 @@
 """Card, Deck, and Shoe classes - immutable card representations."""
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 from random import Random
-from typing import Iterator
+from typing import Iterable, Iterator
 
 
-class Suit(Enum):
-    """Card suits."""
+class Suit(IntEnum):
+    """Card suits (int-valued so comparisons and hashing stay in C)."""
 
     CLUBS = auto()
     DIAMONDS = auto()
@@ -24,8 +24,8 @@ class Suit(Enum):
         return symbols[self]
 
 
-class Rank(Enum):
-    """Card ranks with blackjack values."""
+class Rank(IntEnum):
+    """Card ranks with blackjack values (int-valued, 2-14)."""
 
     TWO = 2
     THREE = 3
@@ -54,21 +54,21 @@ class Rank(Enum):
     @property
     def blackjack_value(self) -> int:
         """Return the blackjack point value (Ace = 11, face cards = 10)."""
-        if self.value <= 10:
-            return self.value
-        if self == Rank.ACE:
-            return 11
-        return 10  # Face cards
+        return _BLACKJACK_VALUES[self]
 
     @property
     def is_ace(self) -> bool:
         """Check if this rank is an Ace."""
-        return self == Rank.ACE
+        return self is Rank.ACE
 
     @property
     def is_ten_value(self) -> bool:
         """Check if this rank has a value of 10."""
-        return self.blackjack_value == 10
+        return _BLACKJACK_VALUES[self] == 10
+
+
+# Blackjack point value indexed by rank value (indexes 0 and 1 are unused)
+_BLACKJACK_VALUES = (0, 0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
 
 
 @dataclass(frozen=True, slots=True)
@@ -87,67 +87,115 @@ class Card:
     @property
     def value(self) -> int:
         """Return the blackjack point value."""
-        return self.rank.blackjack_value
+        return _BLACKJACK_VALUES[self.rank]
 
     @property
     def is_ace(self) -> bool:
         """Check if this card is an Ace."""
-        return self.rank.is_ace
+        return self.rank is Rank.ACE
 
     @property
     def is_ten_value(self) -> bool:
         """Check if this card has a value of 10."""
-        return self.rank.is_ten_value
+        return _BLACKJACK_VALUES[self.rank] == 10
 
     @classmethod
     def from_string(cls, s: str) -> "Card":
         """Create a card from a string like '2♣', 'AS', 'Kh'."""
         s = s.strip().upper()
+        card = _STRING_TO_CARD.get(s)
+        if card is not None:
+            return card
+
         if len(s) < 2:
             raise ValueError(f"Invalid card string: {s}")
-
-        rank_str = s[:-1]
-        suit_str = s[-1]
-
-        rank_map = {
-            "2": Rank.TWO,
-            "3": Rank.THREE,
-            "4": Rank.FOUR,
-            "5": Rank.FIVE,
-            "6": Rank.SIX,
-            "7": Rank.SEVEN,
-            "8": Rank.EIGHT,
-            "9": Rank.NINE,
-            "10": Rank.TEN,
-            "T": Rank.TEN,
-            "J": Rank.JACK,
-            "Q": Rank.QUEEN,
-            "K": Rank.KING,
-            "A": Rank.ACE,
-        }
-
-        suit_map = {
-            "C": Suit.CLUBS,
-            "♣": Suit.CLUBS,
-            "D": Suit.DIAMONDS,
-            "♦": Suit.DIAMONDS,
-            "H": Suit.HEARTS,
-            "♥": Suit.HEARTS,
-            "S": Suit.SPADES,
-            "♠": Suit.SPADES,
-        }
-
-        if rank_str not in rank_map:
-            raise ValueError(f"Invalid rank: {rank_str}")
-        if suit_str not in suit_map:
-            raise ValueError(f"Invalid suit: {suit_str}")
-
-        return cls(rank_map[rank_str], suit_map[suit_str])
+        if s[:-1] not in _RANK_STRINGS:
+            raise ValueError(f"Invalid rank: {s[:-1]}")
+        raise ValueError(f"Invalid suit: {s[-1]}")
+
+
+# One shared instance per distinct card; Card is immutable so reuse is safe
+_CARD_POOL: dict[tuple[Rank, Suit], Card] = {
+    (rank, suit): Card(rank, suit) for suit in Suit for rank in Rank
+}
+
+# Accepted (upper-cased) spellings for Card.from_string
+_RANK_STRINGS = {
+    "2": Rank.TWO,
+    "3": Rank.THREE,
+    "4": Rank.FOUR,
+    "5": Rank.FIVE,
+    "6": Rank.SIX,
+    "7": Rank.SEVEN,
+    "8": Rank.EIGHT,
+    "9": Rank.NINE,
+    "10": Rank.TEN,
+    "T": Rank.TEN,
+    "J": Rank.JACK,
+    "Q": Rank.QUEEN,
+    "K": Rank.KING,
+    "A": Rank.ACE,
+}
+_SUIT_STRINGS = {
+    "C": Suit.CLUBS,
+    "♣": Suit.CLUBS,
+    "D": Suit.DIAMONDS,
+    "♦": Suit.DIAMONDS,
+    "H": Suit.HEARTS,
+    "♥": Suit.HEARTS,
+    "S": Suit.SPADES,
+    "♠": Suit.SPADES,
+}
+_STRING_TO_CARD: dict[str, Card] = {
+    rank_str + suit_str: _CARD_POOL[rank, suit]
+    for rank_str, rank in _RANK_STRINGS.items()
+    for suit_str, suit in _SUIT_STRINGS.items()
+}
+
+
+def encode_card(card: Card) -> int:
+    """
+    Pack a card into a one-byte code.
+
+    The rank value (2-14) is stored in the high bits and the suit index
+    (0-3, in Suit declaration order) in the low 2 bits.
+    """
+    return (card.rank << 2) | (card.suit - 1)
+
+
+# Shared Card instance for every valid card code
+_CARDS_BY_CODE: dict[int, Card] = {
+    encode_card(card): card for card in _CARD_POOL.values()
+}
+_CARD_CODES = bytes(_CARDS_BY_CODE)
+
+
+def decode_card(code: int) -> Card:
+    """Return the card for a code from encode_card (KeyError if invalid)."""
+    return _CARDS_BY_CODE[code]
+
+
+def encode_cards(cards: Iterable[Card]) -> bytes:
+    """Pack a card sequence into one code byte per card."""
+    return bytes([encode_card(card) for card in cards])
+
+
+def decode_cards(codes: bytes) -> list[Card]:
+    """Unpack a card sequence from encode_cards (KeyError if invalid)."""
+    cards_by_code = _CARDS_BY_CODE
+    return [cards_by_code[code] for code in codes]
+
+
+# One deck in its unshuffled order, as cards and as codes
+_DECK_TEMPLATE = tuple(_CARD_POOL[rank, suit] for suit in Suit for rank in Rank)
+_DECK_CODES = encode_cards(_DECK_TEMPLATE)
 
 
 class Deck:
     """A standard 52-card deck."""
 
+    __slots__ = ("_rng", "_cards")
+
     def __init__(self, rng: Random | None = None) -> None:
         """Initialize a new deck."""
         self._rng = rng or Random()
@@ -156,7 +204,7 @@ class Deck:
 
     def reset(self) -> None:
         """Reset deck to all 52 cards in order."""
-        self._cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self._cards = list(_DECK_TEMPLATE)
 
     def shuffle(self) -> None:
         """Shuffle the deck."""
@@ -181,7 +229,21 @@ class Deck:
 
 
 class Shoe:
-    """A multi-deck shoe for blackjack."""
+    """
+    A multi-deck shoe for blackjack.
+
+    Cards are held as one-byte codes (see encode_card) and only turned into
+    Card objects as they are drawn or iterated.
+    """
+
+    __slots__ = (
+        "_num_decks",
+        "_penetration",
+        "_rng",
+        "_cards",
+        "_cut_card_position",
+        "_cards_left_at_cut",
+    )
 
     def __init__(
         self,
@@ -205,19 +267,16 @@ class Shoe:
         self._num_decks = num_decks
         self._penetration = penetration
         self._rng = rng or Random()
-        self._cards: list[Card] = []
+        self._cards = bytearray()
         self._cut_card_position: int = 0
+        self._cards_left_at_cut: int = 0
         self.reset()
 
     def reset(self) -> None:
         """Reset shoe to all cards from all decks."""
-        self._cards = [
-            Card(rank, suit)
-            for _ in range(self._num_decks)
-            for suit in Suit
-            for rank in Rank
-        ]
+        self._cards = bytearray(_DECK_CODES * self._num_decks)
         self._cut_card_position = int(len(self._cards) * self._penetration)
+        self._cards_left_at_cut = len(self._cards) - self._cut_card_position
 
     def shuffle(self) -> None:
         """Shuffle all cards in the shoe."""
@@ -228,12 +287,28 @@ class Shoe:
         """Draw a card from the shoe."""
         if not self._cards:
             raise IndexError("Cannot draw from empty shoe")
-        return self._cards.pop()
+        return _CARDS_BY_CODE[self._cards.pop()]
+
+    @property
+    def card_codes(self) -> bytes:
+        """Return the remaining cards as codes; the last byte is drawn next."""
+        return bytes(self._cards)
+
+    def restore_card_codes(self, codes: bytes) -> None:
+        """
+        Replace the remaining cards with codes from card_codes.
+
+        Raises:
+            ValueError: If any byte is not a valid card code
+        """
+        if codes.translate(None, _CARD_CODES):
+            raise ValueError("Invalid card code in shoe data")
+        self._cards = bytearray(codes)
 
     @property
     def needs_shuffle(self) -> bool:
         """Check if the cut card has been reached."""
-        return len(self._cards) <= (self.total_cards - self._cut_card_position)
+        return len(self._cards) <= self._cards_left_at_cut
 
     @property
     def cards_remaining(self) -> int:
@@ -269,4 +344,4 @@ class Shoe:
         return len(self._cards)
 
     def __iter__(self) -> Iterator[Card]:
-        return iter(self._cards)
+        return map(_CARDS_BY_CODE.__getitem__, self._cards)
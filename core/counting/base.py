@@ -64,6 +64,10 @@ class CountingSystem(ABC):
         """
         Count a single card and update the running count.
 
+        Subclasses that override this (e.g. to keep a side count) are still
+        honoured by count_cards, which then counts card by card unless the
+        subclass also overrides count_cards.
+
         Args:
             card: The card to count
 
@@ -85,9 +89,16 @@ class CountingSystem(ABC):
         Returns:
             The total tag value of all cards
         """
-        total = 0.0
-        for card in cards:
-            total += self.count_card(card)
+        if type(self).count_card is not CountingSystem.count_card:
+            return sum([self.count_card(card) for card in cards], 0.0)
+        return self._count_tags(cards)
+
+    def _count_tags(self, cards: list[Card]) -> float:
+        """Add the cards' tags to the running count in one pass (tags only)."""
+        tag_values = self.tag_values
+        total = sum([tag_values[card.rank] for card in cards], 0.0)
+        self._running_count += total
+        self._cards_seen += len(cards)
         return total
 
     @property
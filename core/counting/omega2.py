@@ -64,6 +64,11 @@ class Omega2System(CountingSystem):
             self._aces_seen += 1
         return super().count_card(card)
 
+    def count_cards(self, cards: list[Card]) -> float:
+        """Count multiple cards and track aces separately."""
+        self._aces_seen += sum(1 for card in cards if card.rank is Rank.ACE)
+        return self._count_tags(cards)
+
     @property
     def aces_seen(self) -> int:
         """Return the number of aces seen."""
@@ -3,10 +3,13 @@
 from dataclasses import dataclass, field
 from typing import Iterator
 
-from core.cards import Card
+from core.cards import Card, Rank
 
+# Point value of each rank with aces counted as 1, indexed by rank value
+_HARD_VALUES = (0, 0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
 
-@dataclass
+
+@dataclass(slots=True)
 class Hand:
     """A blackjack hand with value calculation."""
 
@@ -27,28 +30,24 @@ class Hand:
         self.is_split_hand = False
         self.is_surrendered = False
 
+    def _hard_total(self) -> tuple[int, bool]:
+        """Return the total with every ace counted as 1, and whether there is an ace."""
+        cards = self.cards
+        total = sum([_HARD_VALUES[card.rank] for card in cards])
+        return total, any(card.rank is Rank.ACE for card in cards)
+
     @property
     def value(self) -> int:
         """
         Calculate the best hand value.
 
         Returns the highest value that doesn't bust, or the lowest bust value.
+        At most one ace can count as 11, so that is worth 10 more whenever
+        it fits.
         """
-        total = 0
-        aces = 0
-
-        for card in self.cards:
-            if card.is_ace:
-                aces += 1
-                total += 11
-            else:
-                total += card.value
-
-        # Reduce aces from 11 to 1 as needed
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-
+        total, has_ace = self._hard_total()
+        if has_ace and total <= 11:
+            return total + 10
         return total
 
     @property
@@ -59,14 +58,8 @@ class Hand:
         A hand is soft if it contains an ace that can be counted as 11
         without busting.
         """
-        if not any(card.is_ace for card in self.cards):
-            return False
-
-        # Calculate value without any aces as 11
-        total_hard = sum(1 if card.is_ace else card.value for card in self.cards)
-
-        # If we can add 10 (making one ace worth 11) without busting, it's soft
-        return total_hard + 10 <= 21
+        total, has_ace = self._hard_total()
+        return has_ace and total <= 11
 
     @property
     def is_hard(self) -> bool:
@@ -76,11 +69,7 @@ class Hand:
     @property
     def is_blackjack(self) -> bool:
         """Check if the hand is a natural blackjack (21 with 2 cards)."""
-        return (
-            len(self.cards) == 2
-            and self.value == 21
-            and not self.is_split_hand
-        )
+        return _is_natural(self, self.value)
 
     @property
     def is_busted(self) -> bool:
@@ -131,44 +120,69 @@ class Hand:
         return f"Hand({self.cards!r}, value={self.value})"
 
 
-def evaluate_hands(player_hand: Hand, dealer_hand: Hand) -> int:
-    """
-    Compare player and dealer hands.
+def _is_natural(hand: Hand, value: int) -> bool:
+    """Check for a natural blackjack given the hand's already-computed value."""
+    return value == 21 and len(hand.cards) == 2 and not hand.is_split_hand
 
-    Returns:
-        1 if player wins
-        -1 if dealer wins
-        0 if push (tie)
-    """
-    player_value = player_hand.value
-    dealer_value = dealer_hand.value
 
+def _outcome_before_values(
+    surrendered: bool,
+    player_bust: bool,
+    dealer_bust: bool,
+    player_bj: bool,
+    dealer_bj: bool,
+) -> int | None:
+    """Settle a hand from its flags, or return None if totals must be compared."""
     # Handle surrendered hands
-    if player_hand.is_surrendered:
+    if surrendered:
         return -1
-
     # Player busts always loses
-    if player_hand.is_busted:
+    if player_bust:
         return -1
-
     # Dealer busts, player wins
-    if dealer_hand.is_busted:
+    if dealer_bust:
         return 1
-
     # Blackjack comparisons
-    player_bj = player_hand.is_blackjack
-    dealer_bj = dealer_hand.is_blackjack
-
     if player_bj and dealer_bj:
         return 0  # Push
     if player_bj:
         return 1  # Player blackjack wins
     if dealer_bj:
         return -1  # Dealer blackjack wins
+    return None
+
+
+# Outcome for every combination of the five flags, indexed by
+# surrendered << 4 | player_bust << 3 | dealer_bust << 2 | player_bj << 1 | dealer_bj
+_OUTCOMES: tuple[int | None, ...] = tuple(
+    _outcome_before_values(*(bool(key >> bit & 1) for bit in range(4, -1, -1)))
+    for key in range(32)
+)
+
+
+def evaluate_hands(player_hand: Hand, dealer_hand: Hand) -> int:
+    """
+    Compare player and dealer hands.
+
+    Returns:
+        1 if player wins
+        -1 if dealer wins
+        0 if push (tie)
+    """
+    player_value = player_hand.value
+    dealer_value = dealer_hand.value
+    player_bj = _is_natural(player_hand, player_value)
+    dealer_bj = _is_natural(dealer_hand, dealer_value)
+
+    outcome = _OUTCOMES[
+        player_hand.is_surrendered << 4
+        | (player_value > 21) << 3
+        | (dealer_value > 21) << 2
+        | player_bj << 1
+        | dealer_bj
+    ]
+    if outcome is not None:
+        return outcome
 
     # Compare values
-    if player_value > dealer_value:
-        return 1
-    if dealer_value > player_value:
-        return -1
-    return 0  # Push
+    return (player_value > dealer_value) - (player_value < dealer_value)
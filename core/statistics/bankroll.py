@@ -199,7 +199,7 @@ class BankrollManager:
         # Linear ramp: 1 unit per TC above threshold
         units = int(true_count - tc_threshold + 1)
         units = min(units, max_spread)
-        bet = unit_size * Decimal(str(units))
+        bet = unit_size * units  # Decimal * int is exact; no str round-trip
 
         return min(bet, self.max_bet).quantize(Decimal("1"))
 
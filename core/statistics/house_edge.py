@@ -1,6 +1,7 @@
 """House edge calculations."""
 
 from decimal import Decimal
+from functools import lru_cache
 
 from core.strategy.rules import RuleSet
 
@@ -13,38 +14,51 @@ class HouseEdgeCalculator:
     with adjustments for each rule variation.
     """
 
-    # Rule effects on house edge (in percentage points)
+    # Rule effects on house edge (in hundredths of a percentage point, so
+    # calculate() sums plain ints and builds a single Decimal at the end)
     # Positive = increases house edge (bad for player)
     # Negative = decreases house edge (good for player)
-    _RULE_EFFECTS = {
+    _RULE_EFFECTS: dict[str, int] = {
         # Number of decks (baseline is 6)
-        "single_deck": Decimal("-0.48"),
-        "double_deck": Decimal("-0.19"),
-        "four_deck": Decimal("-0.06"),
-        "six_deck": Decimal("0.00"),  # Baseline
-        "eight_deck": Decimal("+0.02"),
+        "single_deck": -48,
+        "double_deck": -19,
+        "four_deck": -6,
+        "six_deck": 0,  # Baseline
+        "eight_deck": +2,
         # Dealer rules
-        "h17": Decimal("+0.22"),  # Hit soft 17 vs stand
+        "h17": +22,  # Hit soft 17 vs stand
         # Blackjack payout
-        "bj_6_5": Decimal("+1.39"),  # 6:5 vs 3:2
-        "bj_1_1": Decimal("+2.27"),  # Even money vs 3:2
+        "bj_6_5": +139,  # 6:5 vs 3:2
+        "bj_1_1": +227,  # Even money vs 3:2
         # Double rules
-        "no_das": Decimal("+0.14"),  # No double after split
-        "double_10_11_only": Decimal("+0.18"),
-        "double_9_11_only": Decimal("+0.09"),
+        "no_das": +14,  # No double after split
+        "double_10_11_only": +18,
+        "double_9_11_only": +9,
         # Split rules
-        "no_resplit": Decimal("+0.03"),
-        "resplit_aces": Decimal("-0.08"),
-        "hit_split_aces": Decimal("-0.19"),
+        "no_resplit": +3,
+        "resplit_aces": -8,
+        "hit_split_aces": -19,
         # Surrender
-        "late_surrender": Decimal("-0.08"),
-        "early_surrender": Decimal("-0.39"),
+        "late_surrender": -8,
+        "early_surrender": -39,
         # Other
-        "dealer_no_peek": Decimal("+0.11"),  # ENHC rules
+        "dealer_no_peek": +11,  # ENHC rules
     }
 
     # Baseline house edge with standard Vegas rules
-    _BASELINE = Decimal("0.50")  # 0.50% with 6 decks, S17, 3:2 BJ, DAS
+    _BASELINE = 50  # 0.50% with 6 decks, S17, 3:2 BJ, DAS
+
+    # Each true count point is worth ~0.5%
+    _TC_VALUE = Decimal("0.5")
+
+    # Deck-count adjustment keyed by number of decks
+    _DECK_EFFECTS: dict[int, int] = {
+        1: _RULE_EFFECTS["single_deck"],
+        2: _RULE_EFFECTS["double_deck"],
+        4: _RULE_EFFECTS["four_deck"],
+        6: _RULE_EFFECTS["six_deck"],
+        8: _RULE_EFFECTS["eight_deck"],
+    }
 
     def __init__(self, rules: RuleSet) -> None:
         """
@@ -62,55 +76,55 @@ class HouseEdgeCalculator:
         Returns:
             House edge as a percentage (e.g., 0.50 for 0.50%)
         """
-        edge = self._BASELINE
+        return self._edge_for(self.rules)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _edge_for(cls, rules: RuleSet) -> Decimal:
+        """Compute the house edge for a rule set (cached; RuleSet is frozen)."""
+        effects = cls._RULE_EFFECTS
+        edge = cls._BASELINE
 
         # Deck adjustments
-        deck_effects = {
-            1: self._RULE_EFFECTS["single_deck"],
-            2: self._RULE_EFFECTS["double_deck"],
-            4: self._RULE_EFFECTS["four_deck"],
-            6: self._RULE_EFFECTS["six_deck"],
-            8: self._RULE_EFFECTS["eight_deck"],
-        }
-        edge += deck_effects.get(self.rules.num_decks, Decimal("0"))
+        edge += cls._DECK_EFFECTS.get(rules.num_decks, 0)
 
         # H17 vs S17
-        if self.rules.dealer_hits_soft_17:
-            edge += self._RULE_EFFECTS["h17"]
+        if rules.dealer_hits_soft_17:
+            edge += effects["h17"]
 
         # Blackjack payout
-        if self.rules.blackjack_payout <= 1.2:  # 6:5
-            edge += self._RULE_EFFECTS["bj_6_5"]
-        elif self.rules.blackjack_payout <= 1.0:  # Even money
-            edge += self._RULE_EFFECTS["bj_1_1"]
+        if rules.blackjack_payout <= 1.2:  # 6:5
+            edge += effects["bj_6_5"]
+        elif rules.blackjack_payout <= 1.0:  # Even money
+            edge += effects["bj_1_1"]
 
         # Double after split
-        if not self.rules.double_after_split:
-            edge += self._RULE_EFFECTS["no_das"]
+        if not rules.double_after_split:
+            edge += effects["no_das"]
 
         # Double restrictions
-        if self.rules.double_on == "10-11":
-            edge += self._RULE_EFFECTS["double_10_11_only"]
-        elif self.rules.double_on == "9-11":
-            edge += self._RULE_EFFECTS["double_9_11_only"]
+        if rules.double_on == "10-11":
+            edge += effects["double_10_11_only"]
+        elif rules.double_on == "9-11":
+            edge += effects["double_9_11_only"]
 
         # Split rules
-        if self.rules.resplit_aces:
-            edge += self._RULE_EFFECTS["resplit_aces"]
-        if self.rules.hit_split_aces:
-            edge += self._RULE_EFFECTS["hit_split_aces"]
+        if rules.resplit_aces:
+            edge += effects["resplit_aces"]
+        if rules.hit_split_aces:
+            edge += effects["hit_split_aces"]
 
         # Surrender
-        if self.rules.surrender == "late":
-            edge += self._RULE_EFFECTS["late_surrender"]
-        elif self.rules.surrender == "early":
-            edge += self._RULE_EFFECTS["early_surrender"]
+        if rules.surrender == "late":
+            edge += effects["late_surrender"]
+        elif rules.surrender == "early":
+            edge += effects["early_surrender"]
 
         # Dealer peek
-        if not self.rules.dealer_peeks:
-            edge += self._RULE_EFFECTS["dealer_no_peek"]
+        if not rules.dealer_peeks:
+            edge += effects["dealer_no_peek"]
 
-        return edge
+        return Decimal(edge).scaleb(-2)
 
     def player_advantage_with_count(
         self,
@@ -132,9 +146,7 @@ class HouseEdgeCalculator:
         if base_edge is None:
             base_edge = self.calculate()
 
-        # Each true count point is worth ~0.5%
-        tc_value = Decimal("0.5")
-        player_advantage = Decimal(str(true_count)) * tc_value - base_edge
+        player_advantage = Decimal(str(true_count)) * self._TC_VALUE - base_edge
 
         return player_advantage
 
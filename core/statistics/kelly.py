@@ -32,6 +32,17 @@ class KellyCalculator:
         self.max_bet = max_bet
         self.kelly_fraction = kelly_fraction
 
+    @property
+    def kelly_fraction(self) -> float:
+        """Fraction of Kelly to use (0.5 = half Kelly)."""
+        return self._kelly_fraction
+
+    @kelly_fraction.setter
+    def kelly_fraction(self, value: float) -> None:
+        self._kelly_fraction = value
+        # Converted once here rather than on every bet calculation
+        self._fraction = Decimal(str(value))
+
     def optimal_bet(
         self,
         player_edge: Decimal,
@@ -59,7 +70,7 @@ class KellyCalculator:
         full_kelly = player_edge * self.bankroll
 
         # Apply Kelly fraction
-        optimal = full_kelly * Decimal(str(self.kelly_fraction))
+        optimal = full_kelly * self._fraction
 
         # Clamp to table limits
         optimal = max(self.min_bet, min(optimal, self.max_bet))
@@ -89,7 +100,7 @@ class KellyCalculator:
 
         # Variance-adjusted Kelly: edge / variance * bankroll
         full_kelly = (player_edge / variance) * self.bankroll
-        optimal = full_kelly * Decimal(str(self.kelly_fraction))
+        optimal = full_kelly * self._fraction
 
         return max(self.min_bet, min(optimal, self.max_bet)).quantize(Decimal("1"))
 
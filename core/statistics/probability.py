@@ -59,6 +59,18 @@ class DealerProbabilities:
         }
 
 
+# Dealer hand total for each outcome (bust counted as 0)
+_OUTCOME_TOTALS: dict[DealerOutcome, int] = {
+    DealerOutcome.BUST: 0,
+    DealerOutcome.SEVENTEEN: 17,
+    DealerOutcome.EIGHTEEN: 18,
+    DealerOutcome.NINETEEN: 19,
+    DealerOutcome.TWENTY: 20,
+    DealerOutcome.TWENTY_ONE: 21,
+    DealerOutcome.BLACKJACK: 21,
+}
+
+
 class ProbabilityEngine:
     """
     Pre-computed probability tables for blackjack.
@@ -96,6 +108,12 @@ class ProbabilityEngine:
         11: DealerProbabilities(11, 0.1271, 0.1195, 0.1195, 0.1297, 0.1297, 0.0436, 0.3309),
     }
 
+    # Bust probability on the next hit for hard totals 12-20
+    _PLAYER_BUST_PROBS: tuple[float, ...] = (
+        4 / 13,  # 12: only 10-value cards bust
+        *((10 - (21 - total)) / 13 for total in range(13, 21)),
+    )
+
     def __init__(self, rules: RuleSet | None = None) -> None:
         """
         Initialize the probability engine.
@@ -141,17 +159,7 @@ class ProbabilityEngine:
             return 0.0
         if hard_total >= 21:
             return 1.0
-
-        # Cards that will bust: those that make total > 21
-        bust_cards = hard_total - 21 + 10  # Number of ranks that bust
-        # Each rank has probability 1/13 (infinite deck)
-        # 10-value cards (10, J, Q, K) count as one "rank" for busting purposes
-        if hard_total == 12:
-            return 4 / 13  # Only 10-value busts
-        elif hard_total <= 21:
-            safe_values = 21 - hard_total
-            return (10 - safe_values) / 13 if safe_values < 10 else 4 / 13
-        return 1.0
+        return self._PLAYER_BUST_PROBS[hard_total - 12]
 
     def expected_value(
         self,
@@ -191,15 +199,7 @@ class ProbabilityEngine:
 
     def _outcome_to_total(self, outcome: DealerOutcome) -> int:
         """Convert a dealer outcome to a hand total."""
-        return {
-            DealerOutcome.BUST: 0,
-            DealerOutcome.SEVENTEEN: 17,
-            DealerOutcome.EIGHTEEN: 18,
-            DealerOutcome.NINETEEN: 19,
-            DealerOutcome.TWENTY: 20,
-            DealerOutcome.TWENTY_ONE: 21,
-            DealerOutcome.BLACKJACK: 21,
-        }[outcome]
+        return _OUTCOME_TOTALS[outcome]
 
     @staticmethod
     def card_probability(rank_value: int, cards_seen: Mapping[int, int] | None = None) -> float:
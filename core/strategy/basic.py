@@ -32,6 +32,22 @@ PlayerTotal = int  # Hard total or soft total value
 HandKey = tuple[str, int]  # ("hard", 16) or ("soft", 17) or ("pair", 8)
 
 
+# How each gated action resolves: (index of the permission it depends on in
+# (can_double, can_surrender, can_split), action if allowed, action if not).
+# Actions not listed are returned unchanged.
+_DOUBLE_GATE, _SURRENDER_GATE, _SPLIT_GATE = 0, 1, 2
+_RESOLUTIONS: dict[Action, tuple[int, Action, Action]] = {
+    Action.DOUBLE_OR_HIT: (_DOUBLE_GATE, Action.DOUBLE, Action.HIT),
+    Action.DOUBLE_OR_STAND: (_DOUBLE_GATE, Action.DOUBLE, Action.STAND),
+    Action.SURRENDER_OR_HIT: (_SURRENDER_GATE, Action.SURRENDER, Action.HIT),
+    Action.SURRENDER_OR_STAND: (_SURRENDER_GATE, Action.SURRENDER, Action.STAND),
+    Action.SURRENDER_OR_SPLIT: (_SURRENDER_GATE, Action.SURRENDER, Action.SPLIT),
+    Action.SPLIT: (_SPLIT_GATE, Action.SPLIT, Action.HIT),
+    Action.DOUBLE: (_DOUBLE_GATE, Action.DOUBLE, Action.HIT),
+    Action.SURRENDER: (_SURRENDER_GATE, Action.SURRENDER, Action.HIT),
+}
+
+
 class BasicStrategy:
     """
     Basic strategy lookup tables.
@@ -115,23 +131,12 @@ class BasicStrategy:
         can_split: bool,
     ) -> Action:
         """Resolve conditional actions based on what's allowed."""
-        if action == Action.DOUBLE_OR_HIT:
-            return Action.DOUBLE if can_double else Action.HIT
-        if action == Action.DOUBLE_OR_STAND:
-            return Action.DOUBLE if can_double else Action.STAND
-        if action == Action.SURRENDER_OR_HIT:
-            return Action.SURRENDER if can_surrender else Action.HIT
-        if action == Action.SURRENDER_OR_STAND:
-            return Action.SURRENDER if can_surrender else Action.STAND
-        if action == Action.SURRENDER_OR_SPLIT:
-            return Action.SURRENDER if can_surrender else Action.SPLIT
-        if action == Action.SPLIT and not can_split:
-            return Action.HIT
-        if action == Action.DOUBLE and not can_double:
-            return Action.HIT
-        if action == Action.SURRENDER and not can_surrender:
-            return Action.HIT
-        return action
+        resolution = _RESOLUTIONS.get(action)
+        if resolution is None:
+            return action
+        gate, if_allowed, otherwise = resolution
+        allowed = (can_double, can_surrender, can_split)[gate]
+        return if_allowed if allowed else otherwise
 
     def _build_hard_table(self) -> Mapping[tuple[int, int], Action]:
         """Build hard totals strategy table."""
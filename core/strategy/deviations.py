@@ -6,7 +6,7 @@ from typing import Literal
 from core.strategy.basic import Action
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IndexPlay:
     """
     An index play (strategy deviation based on count).
@@ -326,6 +326,45 @@ FAB_4: list[IndexPlay] = [
 ]
 
 
+_HandKey = tuple[int, bool, bool, int]
+
+
+def _index_by_hand(plays: list[IndexPlay]) -> dict[_HandKey, tuple[IndexPlay, ...]]:
+    """Group plays by (player_total, is_soft, is_pair, dealer_upcard), keeping order."""
+    index: dict[_HandKey, list[IndexPlay]] = {}
+    for play in plays:
+        key = (play.player_total, play.is_soft, play.is_pair, play.dealer_upcard)
+        index.setdefault(key, []).append(play)
+    return {key: tuple(group) for key, group in index.items()}
+
+
+# Lookup tables so find_deviation only checks plays for the given hand
+_ILLUSTRIOUS_18_BY_HAND = _index_by_hand(ILLUSTRIOUS_18)
+_FAB_4_BY_HAND = _index_by_hand(FAB_4)
+
+
+def get_illustrious(
+    player_total: int,
+    dealer_upcard: int,
+    is_soft: bool = False,
+    is_pair: bool = False,
+) -> IndexPlay | None:
+    """Return the Illustrious 18 play for a hand, or None if there is none."""
+    plays = _ILLUSTRIOUS_18_BY_HAND.get((player_total, is_soft, is_pair, dealer_upcard))
+    return plays[0] if plays else None
+
+
+def get_fab_4(
+    player_total: int,
+    dealer_upcard: int,
+    is_soft: bool = False,
+    is_pair: bool = False,
+) -> IndexPlay | None:
+    """Return the Fab 4 surrender play for a hand, or None if there is none."""
+    plays = _FAB_4_BY_HAND.get((player_total, is_soft, is_pair, dealer_upcard))
+    return plays[0] if plays else None
+
+
 def find_deviation(
     player_total: int,
     is_soft: bool,
@@ -348,18 +387,14 @@ def find_deviation(
     Returns:
         The applicable IndexPlay if found and TC meets threshold, else None
     """
-    all_plays = ILLUSTRIOUS_18.copy()
-    if include_surrender:
-        all_plays.extend(FAB_4)
-
-    for play in all_plays:
-        if (
-            play.player_total == player_total
-            and play.is_soft == is_soft
-            and play.is_pair == is_pair
-            and play.dealer_upcard == dealer_upcard
-            and play.should_deviate(true_count)
-        ):
+    key = (player_total, is_soft, is_pair, dealer_upcard)
+    for play in _ILLUSTRIOUS_18_BY_HAND.get(key, ()):
+        if play.should_deviate(true_count):
             return play
 
+    if include_surrender:
+        for play in _FAB_4_BY_HAND.get(key, ()):
+            if play.should_deviate(true_count):
+                return play
+
     return None
@@ -1,7 +1,7 @@
 """Title screen scene with animated elements."""
 
 import math
-from typing import Optional
+from typing import Dict, List, Optional
 
 import pygame
 
@@ -11,6 +11,31 @@ from pygame_ui.components.button import Button
 from pygame_ui.effects.crt_filter import CRTFilter
 
 
+# Event types that Button.handle_event reacts to
+_BUTTON_EVENT_TYPES = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
+# Suit glyph fonts keyed by size, shared across scene instances
+_SUIT_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def _get_suit_font(size: int) -> pygame.font.Font:
+    """Get the default font at the given size, loading it only once."""
+    font = _SUIT_FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _SUIT_FONT_CACHE[size] = font
+    return font
+
+
+# Prompt blink: one 1.5s cycle quantized to 256 steps, solid for 70% then fading
+_BLINK_PERIOD = 1.5
+_BLINK_STEPS = 256
+_BLINK_LUT = tuple(
+    255 if i / _BLINK_STEPS < 0.7 else int(255 * (1.0 - (i / _BLINK_STEPS - 0.7) / 0.3))
+    for i in range(_BLINK_STEPS)
+)
+
+
 class TitleScene(BaseScene):
     """Title screen with animated title and start prompt.
 
@@ -21,6 +46,22 @@ class TitleScene(BaseScene):
     - CRT filter overlay
     """
 
+    # Phase offset of each decorative card's bob, one quarter-turn apart
+    _CARD_PHASES = (0.0, math.pi / 2, math.pi, 3 * math.pi / 2)
+
+    # Menu buttons, top to bottom:
+    # (attribute, text, font size, bg color, hover color, height, callback)
+    _BUTTON_SPECS = (
+        ("start_button", "PLAY GAME", 32, (60, 100, 60), (80, 130, 80), 40, "_start_game"),
+        ("drills_button", "TRAINING DRILLS", 26, (80, 80, 120), (100, 100, 150), 32, "_open_drills"),
+        ("performance_button", "PERFORMANCE", 26, (100, 80, 60), (130, 100, 80), 32, "_open_performance"),
+        ("statistics_button", "STATISTICS", 26, (80, 100, 80), (100, 130, 100), 32, "_open_statistics"),
+        ("simulation_button", "SIMULATION", 26, (100, 80, 100), (130, 100, 130), 32, "_open_simulation"),
+        ("history_button", "HAND HISTORY", 26, (80, 90, 80), (100, 120, 100), 32, "_open_history"),
+        ("mistakes_button", "MISTAKE ANALYSIS", 26, (100, 70, 70), (130, 90, 90), 32, "_open_mistakes"),
+        ("settings_button", "SETTINGS", 26, (60, 60, 80), (80, 80, 110), 32, "_open_settings"),
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -36,6 +77,15 @@ class TitleScene(BaseScene):
         self._prompt_font: Optional[pygame.font.Font] = None
         self._version_font: Optional[pygame.font.Font] = None
 
+        # Static renders (built lazily once the display exists)
+        self._title_base: Optional[pygame.Surface] = None
+        self._subtitle_surf: Optional[pygame.Surface] = None
+        self._prompt_surf: Optional[pygame.Surface] = None
+        self._version_surf: Optional[pygame.Surface] = None
+        self._controls_surf: Optional[pygame.Surface] = None
+        self._card_cache: List[pygame.Surface] = []
+        self._bg_layer: Optional[pygame.Surface] = None
+
         # CRT effect
         self.crt_filter = CRTFilter(
             scanline_alpha=20,
@@ -44,6 +94,7 @@ class TitleScene(BaseScene):
         )
 
         # Menu buttons
+        self.buttons: List[Button] = []
         self.start_button: Optional[Button] = None
         self.drills_button: Optional[Button] = None
         self.performance_button: Optional[Button] = None
@@ -61,107 +112,109 @@ class TitleScene(BaseScene):
             self._prompt_font = pygame.font.Font(None, 32)
             self._version_font = pygame.font.Font(None, 24)
 
-    def _init_button(self) -> None:
-        """Initialize menu buttons."""
-        if self.start_button is None:
-            button_y_start = DIMENSIONS.SCREEN_HEIGHT - 340
-            button_spacing = 36
-
-            self.start_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start,
-                text="PLAY GAME",
-                font_size=32,
-                on_click=self._start_game,
-                bg_color=(60, 100, 60),
-                hover_color=(80, 130, 80),
-                width=200,
-                height=40,
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """Convert a surface to the display pixel format for fast blits."""
+        try:
+            return surface.convert_alpha()
+        except pygame.error:
+            # No display mode set yet, keep the original format
+            return surface
+
+    def _init_surfaces(self) -> None:
+        """Render static text once (must be called after _init_fonts)."""
+        if self._title_base is None:
+            convert = self._to_display_format
+            self._title_base = convert(self._title_font.render("BLACKJACK", True, COLORS.GOLD))
+            self._subtitle_surf = convert(
+                self._subtitle_font.render("CARD COUNTING TRAINER", True, COLORS.TEXT_WHITE)
             )
-
-            self.drills_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing,
-                text="TRAINING DRILLS",
-                font_size=26,
-                on_click=self._open_drills,
-                bg_color=(80, 80, 120),
-                hover_color=(100, 100, 150),
-                width=200,
-                height=32,
+            self._prompt_surf = convert(
+                self._prompt_font.render("Press SPACE to start", True, COLORS.TEXT_WHITE)
             )
-
-            self.performance_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing * 2,
-                text="PERFORMANCE",
-                font_size=26,
-                on_click=self._open_performance,
-                bg_color=(100, 80, 60),
-                hover_color=(130, 100, 80),
-                width=200,
-                height=32,
+            self._version_surf = convert(
+                self._version_font.render("v0.1 - Balatro Style UI", True, COLORS.TEXT_MUTED)
             )
-
-            self.statistics_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing * 3,
-                text="STATISTICS",
-                font_size=26,
-                on_click=self._open_statistics,
-                bg_color=(80, 100, 80),
-                hover_color=(100, 130, 100),
-                width=200,
-                height=32,
+            self._controls_surf = convert(
+                self._version_font.render(
+                    "T: Training | P: Perf | S: Stats | M: Sim | H: History | A: Mistakes",
+                    True,
+                    COLORS.TEXT_MUTED,
+                )
             )
 
-            self.simulation_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing * 4,
-                text="SIMULATION",
-                font_size=26,
-                on_click=self._open_simulation,
-                bg_color=(100, 80, 100),
-                hover_color=(130, 100, 130),
-                width=200,
-                height=32,
-            )
+    def _build_bg_layer(self) -> None:
+        """Pre-render the background fill and felt rectangles."""
+        layer = pygame.Surface((DIMENSIONS.SCREEN_WIDTH, DIMENSIONS.SCREEN_HEIGHT))
+        layer.fill(COLORS.BACKGROUND)
 
-            self.history_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing * 5,
-                text="HAND HISTORY",
-                font_size=26,
-                on_click=self._open_history,
-                bg_color=(80, 90, 80),
-                hover_color=(100, 120, 100),
-                width=200,
-                height=32,
-            )
+        # Felt-like pattern in center
+        center_rect = pygame.Rect(
+            DIMENSIONS.SCREEN_WIDTH // 4,
+            DIMENSIONS.SCREEN_HEIGHT // 4,
+            DIMENSIONS.SCREEN_WIDTH // 2,
+            DIMENSIONS.SCREEN_HEIGHT // 2,
+        )
+        pygame.draw.rect(layer, COLORS.FELT_DARK, center_rect, border_radius=20)
+        pygame.draw.rect(layer, COLORS.FELT_GREEN, center_rect.inflate(-8, -8), border_radius=16)
 
-            self.mistakes_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing * 6,
-                text="MISTAKE ANALYSIS",
-                font_size=26,
-                on_click=self._open_mistakes,
-                bg_color=(100, 70, 70),
-                hover_color=(130, 90, 90),
-                width=200,
-                height=32,
-            )
+        try:
+            layer = layer.convert()
+        except pygame.error:
+            pass
+        self._bg_layer = layer
 
-            self.settings_button = Button(
-                x=DIMENSIONS.CENTER_X,
-                y=button_y_start + button_spacing * 7,
-                text="SETTINGS",
-                font_size=26,
-                on_click=self._open_settings,
-                bg_color=(60, 60, 80),
-                hover_color=(80, 80, 110),
-                width=200,
-                height=32,
-            )
+    def _build_card_cache(self) -> None:
+        """Pre-render the four rotated decorative cards."""
+        card_width = 60
+        card_height = 84
+
+        suits = ["♠", "♥", "♣", "♦"]
+        colors = [COLORS.CARD_BLACK, COLORS.CARD_RED, COLORS.CARD_BLACK, COLORS.CARD_RED]
+
+        suit_font = _get_suit_font(48)
+
+        self._card_cache = []
+        for i in range(4):
+            # Slight rotation based on position
+            angle = 15 if i % 2 == 0 else -15
+
+            # Create card surface
+            card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
+            pygame.draw.rect(card_surface, COLORS.CARD_WHITE, (0, 0, card_width, card_height), border_radius=6)
+            pygame.draw.rect(card_surface, COLORS.CARD_BLACK, (0, 0, card_width, card_height), width=2, border_radius=6)
+
+            # Draw suit
+            suit_text = suit_font.render(suits[i], True, colors[i])
+            suit_rect = suit_text.get_rect(center=(card_width // 2, card_height // 2))
+            card_surface.blit(suit_text, suit_rect)
+
+            rotated = pygame.transform.rotate(card_surface, angle)
+            self._card_cache.append(self._to_display_format(rotated))
+
+    def _init_button(self) -> None:
+        """Initialize menu buttons."""
+        if self.start_button is None:
+            button_y_start = DIMENSIONS.SCREEN_HEIGHT - 340
+            button_spacing = 36
+
+            self.buttons = []
+            for i, (attr, text, font_size, bg_color, hover_color, height, callback) in enumerate(
+                self._BUTTON_SPECS
+            ):
+                button = Button(
+                    x=DIMENSIONS.CENTER_X,
+                    y=button_y_start + button_spacing * i,
+                    text=text,
+                    font_size=font_size,
+                    on_click=getattr(self, callback),
+                    bg_color=bg_color,
+                    hover_color=hover_color,
+                    width=200,
+                    height=height,
+                )
+                setattr(self, attr, button)
+                self.buttons.append(button)
 
     def on_enter(self) -> None:
         """Initialize when entering the scene."""
@@ -169,6 +222,8 @@ class TitleScene(BaseScene):
         self._time = 0.0
         self._init_fonts()
         self._init_button()
+        if self._bg_layer is None:
+            self._build_bg_layer()
 
     def _start_game(self) -> None:
         """Transition to the game scene."""
@@ -204,23 +259,11 @@ class TitleScene(BaseScene):
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle input events."""
-        # Handle buttons
-        if self.start_button and self.start_button.handle_event(event):
-            return True
-        if self.drills_button and self.drills_button.handle_event(event):
-            return True
-        if self.performance_button and self.performance_button.handle_event(event):
-            return True
-        if self.statistics_button and self.statistics_button.handle_event(event):
-            return True
-        if self.simulation_button and self.simulation_button.handle_event(event):
-            return True
-        if self.history_button and self.history_button.handle_event(event):
-            return True
-        if self.mistakes_button and self.mistakes_button.handle_event(event):
-            return True
-        if self.settings_button and self.settings_button.handle_event(event):
-            return True
+        # Handle buttons (they only react to mouse events)
+        if event.type in _BUTTON_EVENT_TYPES:
+            for button in self.buttons:
+                if button.handle_event(event):
+                    return True
 
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
@@ -258,39 +301,23 @@ class TitleScene(BaseScene):
         self._title_scale = 1.0 + 0.03 * math.sin(self._time * 2.0)
 
         # Prompt blink animation
-        blink_cycle = (self._time % 1.5) / 1.5
-        if blink_cycle < 0.7:
-            self._prompt_alpha = 255
-        else:
-            self._prompt_alpha = int(255 * (1.0 - (blink_cycle - 0.7) / 0.3))
+        blink_index = int(self._time * (_BLINK_STEPS / _BLINK_PERIOD)) & (_BLINK_STEPS - 1)
+        self._prompt_alpha = _BLINK_LUT[blink_index]
 
         # Floating card animations
-        for i in range(4):
-            phase = i * (math.pi / 2)
-            self._card_offsets[i] = 10 * math.sin(self._time * 1.5 + phase)
+        sin = math.sin
+        card_t = self._time * 1.5
+        self._card_offsets = [10 * sin(card_t + phase) for phase in self._CARD_PHASES]
 
         # Update buttons
-        if self.start_button:
-            self.start_button.update(dt)
-        if self.drills_button:
-            self.drills_button.update(dt)
-        if self.performance_button:
-            self.performance_button.update(dt)
-        if self.statistics_button:
-            self.statistics_button.update(dt)
-        if self.simulation_button:
-            self.simulation_button.update(dt)
-        if self.history_button:
-            self.history_button.update(dt)
-        if self.mistakes_button:
-            self.mistakes_button.update(dt)
-        if self.settings_button:
-            self.settings_button.update(dt)
+        for button in self.buttons:
+            button.update(dt)
 
     def _draw_decorative_cards(self, surface: pygame.Surface) -> None:
         """Draw floating decorative cards in corners."""
-        card_width = 60
-        card_height = 84
+        if not self._card_cache:
+            self._build_card_cache()
+
         margin = 80
 
         positions = [
@@ -300,108 +327,61 @@ class TitleScene(BaseScene):
             (DIMENSIONS.SCREEN_WIDTH - margin, DIMENSIONS.SCREEN_HEIGHT - margin + self._card_offsets[3]),  # Bottom right
         ]
 
-        suits = ["♠", "♥", "♣", "♦"]
-        colors = [COLORS.CARD_BLACK, COLORS.CARD_RED, COLORS.CARD_BLACK, COLORS.CARD_RED]
-
-        for i, (x, y) in enumerate(positions):
-            # Card background
-            card_rect = pygame.Rect(0, 0, card_width, card_height)
-            card_rect.center = (int(x), int(y))
-
-            # Slight rotation based on position
-            angle = 15 if i % 2 == 0 else -15
-
-            # Create card surface
-            card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-            pygame.draw.rect(card_surface, COLORS.CARD_WHITE, (0, 0, card_width, card_height), border_radius=6)
-            pygame.draw.rect(card_surface, COLORS.CARD_BLACK, (0, 0, card_width, card_height), width=2, border_radius=6)
-
-            # Draw suit
-            suit_font = pygame.font.Font(None, 48)
-            suit_text = suit_font.render(suits[i], True, colors[i])
-            suit_rect = suit_text.get_rect(center=(card_width // 2, card_height // 2))
-            card_surface.blit(suit_text, suit_rect)
-
-            # Rotate and blit
-            rotated = pygame.transform.rotate(card_surface, angle)
+        for rotated, (x, y) in zip(self._card_cache, positions):
             rotated_rect = rotated.get_rect(center=(int(x), int(y)))
             surface.blit(rotated, rotated_rect)
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the title screen."""
         self._init_fonts()  # Ensure fonts are ready
+        self._init_surfaces()
 
-        # Background gradient (dark to darker)
-        surface.fill(COLORS.BACKGROUND)
-
-        # Draw felt-like pattern in center
-        center_rect = pygame.Rect(
-            DIMENSIONS.SCREEN_WIDTH // 4,
-            DIMENSIONS.SCREEN_HEIGHT // 4,
-            DIMENSIONS.SCREEN_WIDTH // 2,
-            DIMENSIONS.SCREEN_HEIGHT // 2,
-        )
-        pygame.draw.rect(surface, COLORS.FELT_DARK, center_rect, border_radius=20)
-        pygame.draw.rect(surface, COLORS.FELT_GREEN, center_rect.inflate(-8, -8), border_radius=16)
+        # Background and felt pattern
+        if self._bg_layer is None:
+            self._build_bg_layer()
+        surface.blit(self._bg_layer, (0, 0))
 
         # Draw decorative cards
         self._draw_decorative_cards(surface)
 
         # Draw title with scale animation
-        title_text = "BLACKJACK"
-        title_surface = self._title_font.render(title_text, True, COLORS.GOLD)
+        title_surface = self._title_base
 
-        # Apply scale
-        if self._title_scale != 1.0:
-            new_width = int(title_surface.get_width() * self._title_scale)
-            new_height = int(title_surface.get_height() * self._title_scale)
+        # Apply scale (skipped when it rounds to the unscaled size)
+        base_width, base_height = title_surface.get_size()
+        new_width = int(base_width * self._title_scale)
+        new_height = int(base_height * self._title_scale)
+        if (new_width, new_height) != (base_width, base_height):
             title_surface = pygame.transform.scale(title_surface, (new_width, new_height))
 
         title_rect = title_surface.get_rect(center=(DIMENSIONS.CENTER_X, DIMENSIONS.SCREEN_HEIGHT // 3))
         surface.blit(title_surface, title_rect)
 
         # Draw subtitle
-        subtitle_text = "CARD COUNTING TRAINER"
-        subtitle_surface = self._subtitle_font.render(subtitle_text, True, COLORS.TEXT_WHITE)
+        subtitle_surface = self._subtitle_surf
         subtitle_rect = subtitle_surface.get_rect(center=(DIMENSIONS.CENTER_X, DIMENSIONS.SCREEN_HEIGHT // 3 + 60))
         surface.blit(subtitle_surface, subtitle_rect)
 
         # Draw "Press SPACE to start" with blink (above buttons)
-        prompt_text = "Press SPACE to start"
-        prompt_surface = self._prompt_font.render(prompt_text, True, COLORS.TEXT_WHITE)
+        prompt_surface = self._prompt_surf
         prompt_surface.set_alpha(self._prompt_alpha)
         prompt_rect = prompt_surface.get_rect(center=(DIMENSIONS.CENTER_X, DIMENSIONS.SCREEN_HEIGHT - 375))
         surface.blit(prompt_surface, prompt_rect)
 
         # Draw buttons
-        if self.start_button:
-            self.start_button.draw(surface)
-        if self.drills_button:
-            self.drills_button.draw(surface)
-        if self.performance_button:
-            self.performance_button.draw(surface)
-        if self.statistics_button:
-            self.statistics_button.draw(surface)
-        if self.simulation_button:
-            self.simulation_button.draw(surface)
-        if self.history_button:
-            self.history_button.draw(surface)
-        if self.mistakes_button:
-            self.mistakes_button.draw(surface)
-        if self.settings_button:
-            self.settings_button.draw(surface)
+        for button in self.buttons:
+            button.draw(surface)
 
         # Draw version/credits
-        version_text = "v0.1 - Balatro Style UI"
-        version_surface = self._version_font.render(version_text, True, COLORS.TEXT_MUTED)
+        version_surface = self._version_surf
         version_rect = version_surface.get_rect(bottomright=(DIMENSIONS.SCREEN_WIDTH - 20, DIMENSIONS.SCREEN_HEIGHT - 20))
         surface.blit(version_surface, version_rect)
 
         # Draw controls hint
-        controls_text = "T: Training | P: Perf | S: Stats | M: Sim | H: History | A: Mistakes"
-        controls_surface = self._version_font.render(controls_text, True, COLORS.TEXT_MUTED)
+        controls_surface = self._controls_surf
         controls_rect = controls_surface.get_rect(bottomleft=(20, DIMENSIONS.SCREEN_HEIGHT - 20))
         surface.blit(controls_surface, controls_rect)
 
         # Apply CRT filter
-        self.crt_filter.apply(surface)
+        if self.crt_filter.enabled:
+            self.crt_filter.apply(surface)
@@ -1,7 +1,14 @@
 """Math utility functions for animations and layout."""
 
 import math
-from typing import Tuple, Union
+from typing import Iterable, List, Tuple, Union
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 Number = Union[int, float]
 
@@ -33,7 +40,32 @@ def lerp_tuple(
     Returns:
         Interpolated tuple
     """
-    return tuple(lerp(s, e, t) for s, e in zip(start, end))
+    return tuple([s + (e - s) * t for s, e in zip(start, end)])
+
+
+def lerp_rgba(
+    start: Tuple[Number, Number, Number, Number],
+    end: Tuple[Number, Number, Number, Number],
+    t: float,
+) -> Tuple[float, float, float, float]:
+    """Linear interpolation between two RGBA colors.
+
+    Unrolled fast path of lerp_tuple for the fixed 4-channel case.
+
+    Args:
+        start: Starting color (r, g, b, a)
+        end: Ending color (r, g, b, a)
+        t: Interpolation factor (0.0 to 1.0)
+
+    Returns:
+        Interpolated color
+    """
+    return (
+        start[0] + (end[0] - start[0]) * t,
+        start[1] + (end[1] - start[1]) * t,
+        start[2] + (end[2] - start[2]) * t,
+        start[3] + (end[3] - start[3]) * t,
+    )
 
 
 def clamp(value: Number, min_val: Number, max_val: Number) -> Number:
@@ -50,6 +82,27 @@ def clamp(value: Number, min_val: Number, max_val: Number) -> Number:
     return max(min_val, min(max_val, value))
 
 
+def clamp_i(value: int, min_val: int, max_val: int) -> int:
+    """Clamp an integer between min and max.
+
+    Same result as clamp, with the comparisons inlined instead of calling
+    the min/max builtins, for hot per-pixel and alpha clamps.
+
+    Args:
+        value: Value to clamp
+        min_val: Minimum allowed value
+        max_val: Maximum allowed value
+
+    Returns:
+        Clamped value
+    """
+    if value > max_val:
+        value = max_val
+    if value < min_val:
+        value = min_val
+    return value
+
+
 def inverse_lerp(start: Number, end: Number, value: Number) -> float:
     """Calculate the interpolation factor for a value between start and end.
 
@@ -99,9 +152,24 @@ def distance(p1: Tuple[Number, Number], p2: Tuple[Number, Number]) -> float:
     Returns:
         Distance between points
     """
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
-    return math.sqrt(dx * dx + dy * dy)
+    return math.dist(p1, p2)
+
+
+def distances(
+    origin: Tuple[Number, Number], points: Iterable[Tuple[Number, Number]]
+) -> List[float]:
+    """Calculate distances from one 2D point to many others.
+
+    Args:
+        origin: Reference point (x, y)
+        points: Points to measure to
+
+    Returns:
+        Distance from origin to each point, in order
+    """
+    ox, oy = origin
+    hypot = math.hypot
+    return [hypot(x - ox, y - oy) for x, y in points]
 
 
 def normalize_angle(angle: float) -> float:
@@ -113,36 +181,23 @@ def normalize_angle(angle: float) -> float:
     Returns:
         Normalized angle
     """
-    while angle > 180:
+    angle = math.fmod(angle, 360)
+    if angle > 180:
         angle -= 360
-    while angle < -180:
+    elif angle < -180:
         angle += 360
     return angle
 
 
-def smooth_damp(
+def _smooth_damp_core(
     current: float,
     target: float,
     velocity: float,
     smooth_time: float,
     dt: float,
-    max_speed: float = float("inf"),
+    max_speed: float,
 ) -> Tuple[float, float]:
-    """Smoothly interpolate towards a target using spring-like damping.
-
-    Based on Game Programming Gems 4 smooth damp.
-
-    Args:
-        current: Current value
-        target: Target value
-        velocity: Current velocity (will be modified)
-        smooth_time: Approximate time to reach target
-        dt: Delta time
-        max_speed: Maximum speed
-
-    Returns:
-        Tuple of (new_value, new_velocity)
-    """
+    """Numeric kernel of smooth_damp (JIT-compiled when numba is available)."""
     smooth_time = max(0.0001, smooth_time)
     omega = 2.0 / smooth_time
 
@@ -154,7 +209,7 @@ def smooth_damp(
 
     # Clamp maximum speed
     max_delta = max_speed * smooth_time
-    delta = clamp(delta, -max_delta, max_delta)
+    delta = max(-max_delta, min(max_delta, delta))
     target = current - delta
 
     temp = (velocity + omega * delta) * dt
@@ -167,3 +222,44 @@ def smooth_damp(
         new_velocity = (new_value - original_target) / dt
 
     return new_value, new_velocity
+
+
+if NUMBA_AVAILABLE:
+    # fastmath minus "nnan"/"ninf": max_speed defaults to infinity
+    _smooth_damp_core = numba.njit(
+        cache=True,
+        fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+    )(_smooth_damp_core)
+
+
+def smooth_damp(
+    current: float,
+    target: float,
+    velocity: float,
+    smooth_time: float,
+    dt: float,
+    max_speed: float = float("inf"),
+) -> Tuple[float, float]:
+    """Smoothly interpolate towards a target using spring-like damping.
+
+    Based on Game Programming Gems 4 smooth damp.
+
+    Args:
+        current: Current value
+        target: Target value
+        velocity: Current velocity (will be modified)
+        smooth_time: Approximate time to reach target
+        dt: Delta time
+        max_speed: Maximum speed
+
+    Returns:
+        Tuple of (new_value, new_velocity)
+    """
+    return _smooth_damp_core(
+        float(current),
+        float(target),
+        float(velocity),
+        float(smooth_time),
+        float(dt),
+        float(max_speed),
+    )
@@ -1,11 +1,8 @@
 """Screenshot utility for visual testing."""
 
-import os
 import time
 from typing import Optional
 
-import pyautogui
-
 
 def take_screenshot(path: str = "/tmp/game_screenshot.png") -> str:
     """Take a screenshot and save it.
@@ -16,17 +13,52 @@ def take_screenshot(path: str = "/tmp/game_screenshot.png") -> str:
     Returns:
         Path to saved screenshot
     """
+    # Imported lazily: pyautogui pulls in PIL and platform capture backends
+    import pyautogui
+
     screenshot = pyautogui.screenshot()
     screenshot.save(path)
     return path
 
 
+def _find_window_id(window_title: str) -> Optional[str]:
+    """Find the CGWindowID of the first window titled like window_title (macOS).
+
+    Reads the on-screen window list through Quartz, which pyautogui already
+    depends on on macOS, so no extra process is started.
+
+    Args:
+        window_title: Substring to match against window titles
+
+    Returns:
+        Window id as a string, or None if not found or Quartz is unavailable
+    """
+    try:
+        from Quartz import (
+            CGWindowListCopyWindowInfo,
+            kCGNullWindowID,
+            kCGWindowListOptionOnScreenOnly,
+        )
+    except ImportError:
+        return None
+
+    windows = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID)
+    for window in windows or ():
+        # kCGWindowName is missing without screen recording permission
+        if window_title in (window.get("kCGWindowName") or ""):
+            return str(window["kCGWindowNumber"])
+    return None
+
+
 def take_window_screenshot(
     window_title: str = "Blackjack",
     path: str = "/tmp/game_screenshot.png",
 ) -> Optional[str]:
     """Take a screenshot of a specific window (macOS).
 
+    Falls back to the whole screen if the window cannot be found, and to
+    pyautogui if screencapture is unavailable.
+
     Args:
         window_title: Title of window to capture
         path: Where to save the screenshot
@@ -36,34 +68,23 @@ def take_window_screenshot(
     """
     import subprocess
 
-    # Use screencapture with window selection
-    # -l flag captures a specific window by ID
-    # First, find the window ID
-    script = f'''
-    tell application "System Events"
-        set windowList to every window of every process
-        repeat with proc in every process
-            repeat with win in every window of proc
-                if name of win contains "{window_title}" then
-                    return id of win
-                end if
-            end repeat
-        end repeat
-    end tell
-    return ""
-    '''
+    # -l captures a specific window by id; if that fails or no id was
+    # found, capture the whole screen
+    commands = [["screencapture", "-x", path]]
+    window_id = _find_window_id(window_title)
+    if window_id is not None:
+        commands.insert(0, ["screencapture", "-x", "-l", window_id, path])
 
-    try:
-        # Use screencapture for the whole screen as fallback
-        result = subprocess.run(
-            ["screencapture", "-x", path],
-            capture_output=True,
-            timeout=5,
-        )
-        if result.returncode == 0 and os.path.exists(path):
-            return path
-    except Exception:
-        pass
+    for command in commands:
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=5)
+            if result.returncode == 0:
+                return path
+        except FileNotFoundError:
+            # No screencapture binary, so there is nothing to retry with
+            break
+        except Exception:
+            continue
 
     # Fallback to pyautogui
     return take_screenshot(path)
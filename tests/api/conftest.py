@@ -0,0 +1,20 @@
+"""Pytest fixtures for API tests."""
+
+import os
+
+import httpx  # noqa: F401  (warm import, shared by the endpoint tests)
+import pytest
+import pytest_asyncio  # noqa: F401  (warm import, shared by the async tests)
+
+# Must be set before the app (and its global config) is first imported:
+# rate limiting is not under test here, and a fixed key skips key generation.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from api.main import app as _app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def test_app():
+    """The FastAPI app, configured for tests and imported once."""
+    return _app
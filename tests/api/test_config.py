@@ -1,20 +1,53 @@
 """Tests for configuration classes."""
 
 import os
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+
 import pytest
 from unittest.mock import patch
 
+from config import (
+    AppConfig,
+    CORSConfig,
+    GameConfig,
+    RateLimitConfig,
+    RedisConfig,
+    SecurityConfig,
+    _parse_cors_origins,
+)
+
+_MISSING = object()
+
+
+@contextmanager
+def scoped_env(remove=(), **set_vars):
+    """Temporarily unset and/or set only the given environment variables.
+
+    Unlike patch.dict(os.environ, clear=True) this touches just the named
+    keys instead of snapshotting and restoring the whole environment.
+    """
+    keys = (*remove, *set_vars)
+    saved = {key: os.environ.get(key, _MISSING) for key in keys}
+    for key in remove:
+        os.environ.pop(key, None)
+    os.environ.update(set_vars)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is _MISSING:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
 
 class TestCORSConfig:
     """Tests for CORSConfig class."""
 
     def test_cors_default_origins(self):
         """Test that default CORS origins are set correctly."""
-        # Clear env var to test default
-        with patch.dict(os.environ, {}, clear=True):
-            # Need to reimport to pick up env changes
-            from config import CORSConfig
-
+        with scoped_env(remove=("CORS_ORIGINS",)):
             config = CORSConfig()
 
             assert "http://localhost:8000" in config.allowed_origins
@@ -23,9 +56,6 @@ class TestCORSConfig:
         """Test that CORS origins are parsed from environment variable."""
         env_origins = "http://example.com,http://localhost:3000,http://app.test.com"
         with patch.dict(os.environ, {"CORS_ORIGINS": env_origins}):
-            # Reimport to test fresh parsing
-            from config import _parse_cors_origins
-
             origins = _parse_cors_origins()
 
             assert "http://example.com" in origins
@@ -37,8 +67,6 @@ class TestCORSConfig:
         """Test that CORS origins handles whitespace correctly."""
         env_origins = "  http://example.com  ,  http://localhost:3000  "
         with patch.dict(os.environ, {"CORS_ORIGINS": env_origins}):
-            from config import _parse_cors_origins
-
             origins = _parse_cors_origins()
 
             assert "http://example.com" in origins
@@ -48,16 +76,12 @@ class TestCORSConfig:
 
     def test_cors_default_credentials(self):
         """Test that credentials are allowed by default."""
-        from config import CORSConfig
-
         config = CORSConfig()
 
         assert config.allow_credentials is True
 
     def test_cors_default_methods_and_headers(self):
         """Test that default methods and headers allow all."""
-        from config import CORSConfig
-
         config = CORSConfig()
 
         assert "*" in config.allow_methods
@@ -69,9 +93,7 @@ class TestRateLimitConfig:
 
     def test_rate_limit_defaults(self):
         """Test default rate limit values."""
-        with patch.dict(os.environ, {}, clear=True):
-            from config import RateLimitConfig
-
+        with scoped_env(remove=("RATE_LIMIT_ENABLED", "RATE_LIMIT_RPM")):
             config = RateLimitConfig()
 
             # Default is enabled
@@ -85,8 +107,6 @@ class TestRateLimitConfig:
             os.environ,
             {"RATE_LIMIT_ENABLED": "false", "RATE_LIMIT_RPM": "120"},
         ):
-            from config import RateLimitConfig
-
             config = RateLimitConfig()
 
             assert config.enabled is False
@@ -95,30 +115,23 @@ class TestRateLimitConfig:
     def test_rate_limit_enabled_case_insensitive(self):
         """Test that enabled parsing is case insensitive."""
         with patch.dict(os.environ, {"RATE_LIMIT_ENABLED": "TRUE"}):
-            from config import RateLimitConfig
-
             config = RateLimitConfig()
 
             assert config.enabled is True
 
         with patch.dict(os.environ, {"RATE_LIMIT_ENABLED": "True"}):
-            from config import RateLimitConfig
-
             config = RateLimitConfig()
 
             assert config.enabled is True
 
-    def test_rate_limit_enabled_false_values(self):
+    @pytest.mark.parametrize("false_val", ["false", "FALSE", "False", "0", "no"])
+    def test_rate_limit_enabled_false_values(self, false_val):
         """Test various false values for rate limit enabled."""
-        for false_val in ["false", "FALSE", "False", "0", "no"]:
-            with patch.dict(os.environ, {"RATE_LIMIT_ENABLED": false_val}):
-                from config import RateLimitConfig
-
-                config = RateLimitConfig()
+        with patch.dict(os.environ, {"RATE_LIMIT_ENABLED": false_val}):
+            config = RateLimitConfig()
 
-                # Only "true" (case insensitive) should be True
-                if false_val.lower() != "true":
-                    assert config.enabled is False
+            # Only "true" (case insensitive) should be True
+            assert config.enabled is False
 
 
 class TestSecurityConfig:
@@ -126,13 +139,7 @@ class TestSecurityConfig:
 
     def test_secret_key_auto_generates(self):
         """Test that secret key is auto-generated when not in env."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Clear SECRET_KEY if present
-            if "SECRET_KEY" in os.environ:
-                del os.environ["SECRET_KEY"]
-
-            from config import SecurityConfig
-
+        with scoped_env(remove=("SECRET_KEY",)):
             config = SecurityConfig()
 
             # Should have a secret key
@@ -143,17 +150,13 @@ class TestSecurityConfig:
         """Test that secret key is read from environment."""
         test_key = "my-super-secret-key-12345"
         with patch.dict(os.environ, {"SECRET_KEY": test_key}):
-            from config import SecurityConfig
-
             config = SecurityConfig()
 
             assert config.secret_key == test_key
 
     def test_secret_key_is_random_when_generated(self):
         """Test that auto-generated secret keys are unique."""
-        with patch.dict(os.environ, {}, clear=True):
-            from config import SecurityConfig
-
+        with scoped_env(remove=("SECRET_KEY",)):
             # Generate two configs
             config1 = SecurityConfig()
             config2 = SecurityConfig()
@@ -168,9 +171,7 @@ class TestRedisConfig:
 
     def test_redis_defaults(self):
         """Test default Redis configuration."""
-        with patch.dict(os.environ, {}, clear=True):
-            from config import RedisConfig
-
+        with scoped_env(remove=("REDIS_HOST", "REDIS_PORT", "REDIS_DB", "REDIS_PASSWORD")):
             config = RedisConfig()
 
             assert config.host == "localhost"
@@ -189,8 +190,6 @@ class TestRedisConfig:
                 "REDIS_PASSWORD": "secret123",
             },
         ):
-            from config import RedisConfig
-
             config = RedisConfig()
 
             assert config.host == "redis.example.com"
@@ -200,9 +199,7 @@ class TestRedisConfig:
 
     def test_redis_url_without_password(self):
         """Test Redis URL generation without password."""
-        with patch.dict(os.environ, {}, clear=True):
-            from config import RedisConfig
-
+        with scoped_env(remove=("REDIS_HOST", "REDIS_PORT", "REDIS_DB", "REDIS_PASSWORD")):
             config = RedisConfig()
             url = config.url
 
@@ -211,8 +208,6 @@ class TestRedisConfig:
     def test_redis_url_with_password(self):
         """Test Redis URL generation with password."""
         with patch.dict(os.environ, {"REDIS_PASSWORD": "mypass"}):
-            from config import RedisConfig
-
             config = RedisConfig()
             url = config.url
 
@@ -224,8 +219,6 @@ class TestAppConfig:
 
     def test_app_config_defaults(self):
         """Test default AppConfig values."""
-        from config import AppConfig
-
         config = AppConfig()
 
         assert config.debug is False
@@ -236,16 +229,12 @@ class TestAppConfig:
     def test_app_config_debug_from_env(self):
         """Test debug mode from environment."""
         with patch.dict(os.environ, {"DEBUG": "true"}):
-            from config import AppConfig
-
             config = AppConfig()
 
             assert config.debug is True
 
     def test_app_config_has_nested_configs(self):
         """Test that AppConfig has nested configuration objects."""
-        from config import AppConfig
-
         config = AppConfig()
 
         assert hasattr(config, "redis")
@@ -260,8 +249,6 @@ class TestGameConfig:
 
     def test_game_config_defaults(self):
         """Test default game configuration values."""
-        from config import GameConfig
-
         config = GameConfig()
 
         assert config.num_decks == 6
@@ -277,10 +264,7 @@ class TestGameConfig:
 
     def test_game_config_frozen(self):
         """Test that GameConfig is frozen (immutable)."""
-        from config import GameConfig
-
         config = GameConfig()
 
-        # Should raise FrozenInstanceError
-        with pytest.raises(Exception):  # dataclasses.FrozenInstanceError
+        with pytest.raises(FrozenInstanceError):
             config.num_decks = 8
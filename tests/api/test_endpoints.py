@@ -1,21 +1,42 @@
 """Tests for API endpoints."""
 
+import asyncio
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 
-from api.main import app
+
+# Pre-encoded body for the bulk record requests
+RECORD_HAND_WIN_10 = b'{"stat_type": "hand_win", "value": 10}'
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# All tests share one event loop so they can share one client
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest_asyncio.fixture
-async def client():
-    """Create test client."""
-    transport = ASGITransport(app=app)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(test_app):
+    """Create a test client shared by every test in this module."""
+    transport = ASGITransport(app=test_app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture(loop_scope="module")
+async def session_id(client):
+    """Create a fresh game session for a test that mutates it."""
+    response = await client.post("/api/game/new")
+    return response.json()["session_id"]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_session_id(client):
+    """Create one game session shared by read-only tests."""
+    response = await client.post("/api/game/new")
+    return response.json()["session_id"]
+
+
 async def test_health_check(client):
     """Test health check endpoint."""
     response = await client.get("/api/health")
@@ -23,7 +44,6 @@ async def test_health_check(client):
     assert response.json() == {"status": "healthy"}
 
 
-@pytest.mark.asyncio
 async def test_new_game(client):
     """Test creating a new game."""
     response = await client.post("/api/game/new")
@@ -32,17 +52,12 @@ async def test_new_game(client):
     assert "session_id" in data
 
 
-@pytest.mark.asyncio
-async def test_game_state(client):
+async def test_game_state(client, shared_session_id):
     """Test getting game state."""
-    # Create a new game first
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Get state
     response = await client.get(
         "/api/game/state",
-        headers={"X-Session-ID": session_id},
+        headers={"X-Session-ID": shared_session_id},
     )
     assert response.status_code == 200
     data = response.json()
@@ -52,13 +67,8 @@ async def test_game_state(client):
     assert data["state"] == "WAITING_FOR_BET"
 
 
-@pytest.mark.asyncio
-async def test_place_bet(client):
+async def test_place_bet(client, session_id):
     """Test placing a bet."""
-    # Create a new game
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Place bet
     response = await client.post(
         "/api/game/bet",
@@ -73,12 +83,8 @@ async def test_place_bet(client):
     assert len(data["player_hands"]) >= 1
 
 
-@pytest.mark.asyncio
-async def test_invalid_bet_amount(client):
+async def test_invalid_bet_amount(client, session_id):
     """Test placing an invalid bet."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Try to bet more than bankroll
     response = await client.post(
         "/api/game/bet",
@@ -88,7 +94,6 @@ async def test_invalid_bet_amount(client):
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_house_edge_calculation(client):
     """Test house edge calculation endpoint."""
     response = await client.post(
@@ -109,7 +114,6 @@ async def test_house_edge_calculation(client):
     assert 0 < data["house_edge_percent"] < 2
 
 
-@pytest.mark.asyncio
 async def test_kelly_bet_calculation(client):
     """Test Kelly bet calculation endpoint."""
     response = await client.post(
@@ -127,13 +131,8 @@ async def test_kelly_bet_calculation(client):
     assert "bet_as_percent_of_bankroll" in data
 
 
-@pytest.mark.asyncio
-async def test_counting_drill(client):
+async def test_counting_drill(client, session_id):
     """Test counting drill endpoint."""
-    # Create session
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     response = await client.post(
         "/api/training/counting/drill",
         json={"system": "hilo", "num_cards": 10},
@@ -148,12 +147,8 @@ async def test_counting_drill(client):
     assert len(data["cards"]) == 10
 
 
-@pytest.mark.asyncio
-async def test_strategy_drill(client):
+async def test_strategy_drill(client, session_id):
     """Test strategy drill endpoint."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     response = await client.post(
         "/api/training/strategy/drill",
         json={"include_deviations": False},
@@ -170,17 +165,12 @@ async def test_strategy_drill(client):
 
 # Session stats endpoint tests
 
-@pytest.mark.asyncio
-async def test_session_stats_returns_zeros_initially(client):
+async def test_session_stats_returns_zeros_initially(client, shared_session_id):
     """Test that session stats returns zeros for a new session."""
-    # Create a new game/session
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Get session stats
     response = await client.get(
         "/api/stats/session",
-        headers={"X-Session-ID": session_id},
+        headers={"X-Session-ID": shared_session_id},
     )
     assert response.status_code == 200
     data = response.json()
@@ -193,13 +183,8 @@ async def test_session_stats_returns_zeros_initially(client):
     assert data["strategy_accuracy"] is None
 
 
-@pytest.mark.asyncio
-async def test_session_stats_after_recording(client):
+async def test_session_stats_after_recording(client, session_id):
     """Test session stats reflect recorded data."""
-    # Create a new game/session
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Record some stats
     await client.post(
         f"/api/stats/performance/{session_id}/record",
@@ -223,13 +208,8 @@ async def test_session_stats_after_recording(client):
     assert data["total_wagered"] == 200.0
 
 
-@pytest.mark.asyncio
-async def test_performance_stats_record_hand_win(client):
+async def test_performance_stats_record_hand_win(client, session_id):
     """Test recording a hand win updates performance stats."""
-    # Create a new game/session
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Record a win
     response = await client.post(
         f"/api/stats/performance/{session_id}/record",
@@ -244,12 +224,8 @@ async def test_performance_stats_record_hand_win(client):
     assert data["net_result"] == 50.0
 
 
-@pytest.mark.asyncio
-async def test_performance_stats_record_hand_loss(client):
+async def test_performance_stats_record_hand_loss(client, session_id):
     """Test recording a hand loss updates performance stats."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     response = await client.post(
         f"/api/stats/performance/{session_id}/record",
         json={"stat_type": "hand_loss", "value": 75},
@@ -263,12 +239,8 @@ async def test_performance_stats_record_hand_loss(client):
     assert data["net_result"] == -75.0
 
 
-@pytest.mark.asyncio
-async def test_performance_stats_record_blackjack(client):
+async def test_performance_stats_record_blackjack(client, session_id):
     """Test recording a blackjack win updates performance stats."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     response = await client.post(
         f"/api/stats/performance/{session_id}/record",
         json={"stat_type": "hand_blackjack", "value": 100},
@@ -283,12 +255,8 @@ async def test_performance_stats_record_blackjack(client):
     assert data["net_result"] == 150.0  # 1.5x payout
 
 
-@pytest.mark.asyncio
-async def test_performance_stats_reset(client):
+async def test_performance_stats_reset(client, session_id):
     """Test resetting performance stats."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Record some stats first
     await client.post(
         f"/api/stats/performance/{session_id}/record",
@@ -305,12 +273,8 @@ async def test_performance_stats_reset(client):
     assert data["net_result"] == 0.0
 
 
-@pytest.mark.asyncio
-async def test_performance_stats_get(client):
+async def test_performance_stats_get(client, session_id):
     """Test getting performance stats by session ID."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
     # Record some data
     await client.post(
         f"/api/stats/performance/{session_id}/record",
@@ -330,18 +294,19 @@ async def test_performance_stats_get(client):
     assert data["count_drills_correct"] == 1
 
 
-@pytest.mark.asyncio
-async def test_performance_stats_history_limited(client):
+async def test_performance_stats_history_limited(client, session_id):
     """Test that history is limited to 100 entries."""
-    new_response = await client.post("/api/game/new")
-    session_id = new_response.json()["session_id"]
-
-    # Record more than 100 entries
-    for _ in range(105):
-        await client.post(
-            f"/api/stats/performance/{session_id}/record",
-            json={"stat_type": "hand_win", "value": 10},
+    # Record more than 100 entries. The first request creates the stats
+    # object; the rest are dispatched concurrently against it.
+    record_url = f"/api/stats/performance/{session_id}/record"
+    await client.post(record_url, content=RECORD_HAND_WIN_10, headers=JSON_HEADERS)
+    responses = await asyncio.gather(
+        *(
+            client.post(record_url, content=RECORD_HAND_WIN_10, headers=JSON_HEADERS)
+            for _ in range(104)
         )
+    )
+    assert all(r.status_code == 200 for r in responses)
 
     # Get performance stats
     response = await client.get(f"/api/stats/performance/{session_id}")
@@ -350,3 +315,4 @@ async def test_performance_stats_history_limited(client):
 
     # History should be capped at 100
     assert len(data["history"]) == 100
+    assert data["hands_played"] == 105
@@ -0,0 +1,78 @@
+"""Tests for the static frontend markup, served without a browser."""
+
+from html.parser import HTMLParser
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+class _ElementCollector(HTMLParser):
+    """Collect the attributes of every element that has an id."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.elements: dict[str, dict[str, str | None]] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        element_id = attributes.get("id")
+        if element_id:
+            self.elements[element_id] = attributes
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def elements(test_app):
+    """Elements of the index page, keyed by id."""
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/")
+    assert response.status_code == 200
+    parser = _ElementCollector()
+    parser.feed(response.text)
+    return parser.elements
+
+
+@pytest.mark.parametrize(
+    "element_id",
+    [
+        "game-area",
+        "count-drill-area",
+        "strategy-drill-area",
+        "nav-play",
+        "nav-count-drill",
+        "nav-strategy-drill",
+        "bet-amount",
+        "btn-bet",
+        "action-controls",
+        "result-controls",
+        "drill-num-cards",
+        "drill-system",
+        "drill-speed",
+        "btn-start-drill",
+        "user-count",
+        "stats-panel",
+        "running-count",
+        "true-count",
+        "cards-remaining",
+        "hands-played",
+        "win-rate",
+        "net-result",
+        "toggle-count",
+    ],
+)
+async def test_page_has_element(elements, element_id):
+    """Test the index page contains the elements the UI relies on."""
+    assert element_id in elements
+
+
+async def test_default_bet_amount(elements):
+    """Test the bet input starts at 10."""
+    assert elements["bet-amount"]["value"] == "10"
+
+
+async def test_default_drill_num_cards(elements):
+    """Test the counting drill starts with 10 cards."""
+    assert elements["drill-num-cards"]["value"] == "10"
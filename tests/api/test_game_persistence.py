@@ -1,11 +1,12 @@
 """Tests for game state persistence (serialization/deserialization)."""
 
+import base64
 import pytest
 from decimal import Decimal
 
 from api.routes.game import (
-    _serialize_card,
-    _deserialize_card,
+    _serialize_cards,
+    _deserialize_cards,
     _serialize_hand,
     _deserialize_hand,
     _serialize_game,
@@ -20,20 +21,9 @@ from core.strategy.rules import RuleSet
 class TestCardSerialization:
     """Tests for card serialization."""
 
-    def test_serialize_card_roundtrip(self):
-        """Test that a card can be serialized and deserialized."""
-        card = Card(Rank.ACE, Suit.SPADES)
-
-        serialized = _serialize_card(card)
-        restored = _deserialize_card(serialized)
-
-        assert restored.rank == card.rank
-        assert restored.suit == card.suit
-
-    def test_deserialize_card_preserves_rank_suit(self):
-        """Test that deserialization preserves rank and suit values."""
-        # Test with various cards
-        test_cards = [
+    def test_serialize_cards_roundtrip(self):
+        """Test that a card sequence can be serialized and deserialized."""
+        cards = [
             Card(Rank.TWO, Suit.CLUBS),
             Card(Rank.TEN, Suit.DIAMONDS),
             Card(Rank.JACK, Suit.HEARTS),
@@ -42,23 +32,25 @@ class TestCardSerialization:
             Card(Rank.ACE, Suit.HEARTS),
         ]
 
-        for card in test_cards:
-            serialized = _serialize_card(card)
-            restored = _deserialize_card(serialized)
+        restored = _deserialize_cards(_serialize_cards(cards))
 
-            assert restored.rank == card.rank, f"Rank mismatch for {card}"
-            assert restored.suit == card.suit, f"Suit mismatch for {card}"
+        assert restored == cards
 
-    def test_serialize_card_structure(self):
-        """Test that serialized card has expected structure."""
-        card = Card(Rank.SEVEN, Suit.DIAMONDS)
+    def test_serialize_empty_cards(self):
+        """Test that an empty card sequence round-trips."""
+        assert _deserialize_cards(_serialize_cards([])) == []
 
-        serialized = _serialize_card(card)
+    def test_serialize_cards_structure(self):
+        """Test that serialized cards are base64 text, one code byte per card."""
+        cards = [Card(Rank.SEVEN, Suit.DIAMONDS), Card(Rank.ACE, Suit.SPADES)]
 
-        assert "rank" in serialized
-        assert "suit" in serialized
-        assert serialized["rank"] == Rank.SEVEN.value
-        assert serialized["suit"] == Suit.DIAMONDS.value
+        serialized = _serialize_cards(cards)
+
+        assert isinstance(serialized, str)
+        codes = base64.b64decode(serialized)
+        assert len(codes) == 2
+        assert codes[0] >> 2 == Rank.SEVEN.value
+        assert codes[0] & 3 == 1  # Diamonds
 
 
 class TestHandSerialization:
@@ -74,13 +66,11 @@ class TestHandSerialization:
             bet=100,
         )
 
-        serialized = _serialize_hand(hand)
+        cards, bet, flags = _serialize_hand(hand)
 
-        assert len(serialized["cards"]) == 2
-        assert serialized["bet"] == 100
-        assert serialized["is_doubled"] is False
-        assert serialized["is_split_hand"] is False
-        assert serialized["is_surrendered"] is False
+        assert isinstance(cards, str)
+        assert bet == 100
+        assert flags == 0
 
     def test_deserialize_hand_preserves_flags(self):
         """Test that deserialization preserves hand flags."""
@@ -179,6 +169,16 @@ class TestGameSerialization:
         assert restored.shoe._num_decks == game.shoe._num_decks
         assert restored.shoe._penetration == game.shoe._penetration
 
+    def test_game_roundtrip_preserves_shoe_order(self, game):
+        """Test that the remaining shoe cards survive roundtrip in order."""
+        game.shoe.shuffle()
+
+        serialized = _serialize_game(game)
+        restored = _deserialize_game(serialized)
+
+        assert isinstance(serialized["shoe_cards"], str)
+        assert restored.shoe._cards == game.shoe._cards
+
     def test_game_roundtrip_preserves_rules(self, game):
         """Test that game roundtrip preserves rules."""
         serialized = _serialize_game(game)
@@ -1,10 +1,7 @@
 """Tests for session management."""
 
 import pytest
-import pytest_asyncio
-from datetime import datetime, timedelta
 from unittest.mock import patch
-import time
 
 from api.session import (
     SessionSigner,
@@ -15,6 +12,16 @@ from api.session import (
 )
 
 
+class MockClock:
+    """Manually advanced clock for session expiry tests."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class TestSessionSigner:
     """Tests for SessionSigner class."""
 
@@ -91,15 +98,21 @@ class TestSessionSigner:
         assert token1 != token2
 
 
+# The store tests share one event loop; each still gets a fresh store
+@pytest.mark.asyncio(loop_scope="session")
 class TestInMemorySessionStore:
     """Tests for InMemorySessionStore class."""
 
-    @pytest_asyncio.fixture
-    async def store(self):
+    @pytest.fixture
+    def clock(self):
+        """Create a clock the tests advance by hand."""
+        return MockClock()
+
+    @pytest.fixture
+    def store(self, clock):
         """Create a fresh session store."""
-        return InMemorySessionStore()
+        return InMemorySessionStore(clock=clock)
 
-    @pytest.mark.asyncio
     async def test_set_and_get_session(self, store):
         """Test setting and getting session data."""
         session_id = "test-session"
@@ -110,14 +123,12 @@ class TestInMemorySessionStore:
 
         assert retrieved == data
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_returns_none(self, store):
         """Test that getting a non-existent session returns None."""
         result = await store.get("nonexistent-session")
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_delete_session(self, store):
         """Test deleting a session."""
         session_id = "test-session"
@@ -128,13 +139,11 @@ class TestInMemorySessionStore:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_session_no_error(self, store):
         """Test that deleting a non-existent session doesn't raise an error."""
         # Should not raise
         await store.delete("nonexistent-session")
 
-    @pytest.mark.asyncio
     async def test_exists_check(self, store):
         """Test existence check."""
         session_id = "test-session"
@@ -146,8 +155,7 @@ class TestInMemorySessionStore:
         await store.set(session_id, {"data": "value"}, ttl=3600)
         assert await store.exists(session_id) is True
 
-    @pytest.mark.asyncio
-    async def test_session_expiration(self, store):
+    async def test_session_expiration(self, store, clock):
         """Test that expired sessions are not returned."""
         session_id = "test-session"
         await store.set(session_id, {"data": "value"}, ttl=1)
@@ -156,14 +164,13 @@ class TestInMemorySessionStore:
         assert await store.exists(session_id) is True
 
         # Wait for expiration
-        time.sleep(1.5)
+        clock.now += 1.5
 
         # Should be expired now
         result = await store.get(session_id)
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_cleanup_expired(self, store):
+    async def test_cleanup_expired(self, store, clock):
         """Test cleanup of expired sessions."""
         # Add some sessions with very short TTL
         await store.set("session-1", {"data": 1}, ttl=1)
@@ -171,7 +178,7 @@ class TestInMemorySessionStore:
         await store.set("session-3", {"data": 3}, ttl=3600)  # Long TTL
 
         # Wait for first two to expire
-        time.sleep(1.5)
+        clock.now += 1.5
 
         # Cleanup expired
         count = await store.cleanup_expired()
@@ -181,7 +188,27 @@ class TestInMemorySessionStore:
         assert await store.exists("session-2") is False
         assert await store.exists("session-3") is True
 
-    @pytest.mark.asyncio
+    async def test_cleanup_skips_overwritten_session(self, store, clock):
+        """Test that cleanup keeps a session whose TTL was extended."""
+        await store.set("session-1", {"data": 1}, ttl=1)
+        await store.set("session-1", {"data": 2}, ttl=3600)
+
+        clock.now += 1.5
+
+        assert await store.cleanup_expired() == 0
+        assert await store.get("session-1") == {"data": 2}
+
+    async def test_expiry_heap_stays_bounded(self, store):
+        """Test that re-saving and deleting sessions does not grow the heap."""
+        for i in range(1000):
+            await store.set("session-1", {"data": i}, ttl=3600)
+        assert len(store._expiry_heap) <= 2
+
+        await store.set("session-2", {"data": 0}, ttl=3600)
+        await store.delete("session-1")
+        await store.delete("session-2")
+        assert len(store._expiry_heap) == 0
+
     async def test_overwrite_session(self, store):
         """Test that session data can be overwritten."""
         session_id = "test-session"
@@ -191,7 +218,6 @@ class TestInMemorySessionStore:
         result = await store.get(session_id)
         assert result == {"version": 2}
 
-    @pytest.mark.asyncio
     async def test_create_session_id_signed(self, store):
         """Test that create_session_id returns a signed token by default."""
         session_id = store.create_session_id(signed=True)
@@ -199,7 +225,6 @@ class TestInMemorySessionStore:
         # Signed tokens are longer due to signature
         assert len(session_id) > 36  # UUID length
 
-    @pytest.mark.asyncio
     async def test_create_session_id_unsigned(self, store):
         """Test that create_session_id can return unsigned UUID."""
         session_id = store.create_session_id(signed=False)
@@ -3,6 +3,7 @@
 import pytest
 
 from api.routes.stats import (
+    _safe_ratio,
     _serialize_performance_stats,
     _deserialize_performance_stats,
 )
@@ -133,6 +134,23 @@ class TestStatsSerialization:
         assert restored.history[2].running_count == 5
         assert restored.history[2].true_count == 2.5
 
+    def test_serialized_history_is_independent_of_live_stats(self):
+        """Test that later changes to the live stats leave the snapshot alone."""
+        entry = SessionHistoryEntry(
+            timestamp=1000000,
+            bankroll=1050.0,
+            event_type="hand_result",
+            details={"outcome": "win"},
+        )
+        stats = PerformanceStats(hands_played=1, history=[entry])
+
+        serialized = _serialize_performance_stats(stats)
+        entry.details["outcome"] = "loss"
+        stats.history.append(entry)
+
+        assert len(serialized["history"]) == 1
+        assert serialized["history"][0]["details"] == {"outcome": "win"}
+
     def test_deserialize_with_missing_fields_uses_defaults(self):
         """Test that missing fields get default values."""
         # Minimal data
@@ -209,7 +227,7 @@ class TestSessionStatsCalculations:
         hands_played = 100
         wins = 45
 
-        win_rate = wins / hands_played if hands_played > 0 else 0.0
+        win_rate = _safe_ratio(wins, hands_played, 0.0)
 
         assert win_rate == 0.45
 
@@ -218,7 +236,7 @@ class TestSessionStatsCalculations:
         hands_played = 0
         wins = 0
 
-        win_rate = wins / hands_played if hands_played > 0 else 0.0
+        win_rate = _safe_ratio(wins, hands_played, 0.0)
 
         assert win_rate == 0.0
 
@@ -227,9 +245,7 @@ class TestSessionStatsCalculations:
         count_drills_attempted = 80
         count_drills_correct = 72
 
-        counting_accuracy = None
-        if count_drills_attempted > 0:
-            counting_accuracy = count_drills_correct / count_drills_attempted
+        counting_accuracy = _safe_ratio(count_drills_correct, count_drills_attempted)
 
         assert counting_accuracy == 0.9
 
@@ -238,9 +254,7 @@ class TestSessionStatsCalculations:
         count_drills_attempted = 0
         count_drills_correct = 0
 
-        counting_accuracy = None
-        if count_drills_attempted > 0:
-            counting_accuracy = count_drills_correct / count_drills_attempted
+        counting_accuracy = _safe_ratio(count_drills_correct, count_drills_attempted)
 
         assert counting_accuracy is None
 
@@ -249,9 +263,7 @@ class TestSessionStatsCalculations:
         strategy_drills_attempted = 0
         strategy_drills_correct = 0
 
-        strategy_accuracy = None
-        if strategy_drills_attempted > 0:
-            strategy_accuracy = strategy_drills_correct / strategy_drills_attempted
+        strategy_accuracy = _safe_ratio(strategy_drills_correct, strategy_drills_attempted)
 
         assert strategy_accuracy is None
 
@@ -260,9 +272,7 @@ class TestSessionStatsCalculations:
         strategy_drills_attempted = 50
         strategy_drills_correct = 48
 
-        strategy_accuracy = None
-        if strategy_drills_attempted > 0:
-            strategy_accuracy = strategy_drills_correct / strategy_drills_attempted
+        strategy_accuracy = _safe_ratio(strategy_drills_correct, strategy_drills_attempted)
 
         assert strategy_accuracy == 0.96
 
@@ -39,50 +39,42 @@ def empty_hand():
     return Hand()
 
 
+# Cards for the canonical hands; each fixture gets its own Hand over a copy
+_BLACKJACK_CARDS = (Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.HEARTS))
+_SOFT_17_CARDS = (Card(Rank.ACE, Suit.SPADES), Card(Rank.SIX, Suit.HEARTS))
+_HARD_16_CARDS = (Card(Rank.TEN, Suit.SPADES), Card(Rank.SIX, Suit.HEARTS))
+_PAIR_8S_CARDS = (Card(Rank.EIGHT, Suit.SPADES), Card(Rank.EIGHT, Suit.HEARTS))
+_BUST_CARDS = (*_HARD_16_CARDS, Card(Rank.KING, Suit.CLUBS))
+
+
 @pytest.fixture
 def blackjack_hand():
     """A natural blackjack hand."""
-    hand = Hand()
-    hand.add_card(Card(Rank.ACE, Suit.SPADES))
-    hand.add_card(Card(Rank.KING, Suit.HEARTS))
-    return hand
+    return Hand(cards=list(_BLACKJACK_CARDS))
 
 
 @pytest.fixture
 def soft_17_hand():
     """A soft 17 hand (A-6)."""
-    hand = Hand()
-    hand.add_card(Card(Rank.ACE, Suit.SPADES))
-    hand.add_card(Card(Rank.SIX, Suit.HEARTS))
-    return hand
+    return Hand(cards=list(_SOFT_17_CARDS))
 
 
 @pytest.fixture
 def hard_16_hand():
     """A hard 16 hand (10-6)."""
-    hand = Hand()
-    hand.add_card(Card(Rank.TEN, Suit.SPADES))
-    hand.add_card(Card(Rank.SIX, Suit.HEARTS))
-    return hand
+    return Hand(cards=list(_HARD_16_CARDS))
 
 
 @pytest.fixture
 def pair_8s_hand():
     """A pair of 8s hand."""
-    hand = Hand()
-    hand.add_card(Card(Rank.EIGHT, Suit.SPADES))
-    hand.add_card(Card(Rank.EIGHT, Suit.HEARTS))
-    return hand
+    return Hand(cards=list(_PAIR_8S_CARDS))
 
 
 @pytest.fixture
 def bust_hand():
     """A busted hand."""
-    hand = Hand()
-    hand.add_card(Card(Rank.TEN, Suit.SPADES))
-    hand.add_card(Card(Rank.SIX, Suit.HEARTS))
-    hand.add_card(Card(Rank.KING, Suit.CLUBS))
-    return hand
+    return Hand(cards=list(_BUST_CARDS))
 
 
 @pytest.fixture
@@ -109,19 +101,22 @@ def wong_halves():
     return WongHalvesSystem()
 
 
-@pytest.fixture
+# Rules and strategy tables are read-only, so they are built once per session.
+# Tests must not mutate them. Counting systems keep a running count and stay
+# function-scoped.
+@pytest.fixture(scope="session")
 def rules():
     """Default ruleset."""
     return RuleSet()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vegas_strip_rules():
     """Vegas Strip rules."""
     return RuleSet.vegas_strip()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_strategy(rules):
     """Basic strategy for default rules."""
     return BasicStrategy(rules)
@@ -140,17 +135,17 @@ def game(rng):
 try:
     from hypothesis import strategies as st
 
-    @st.composite
-    def card_strategy(draw):
+    # Built once so every draw reuses the same strategy object
+    _CARD_ST = st.sampled_from([Card(rank, suit) for suit in Suit for rank in Rank])
+
+    def card_strategy():
         """Generate a random card."""
-        rank = draw(st.sampled_from(list(Rank)))
-        suit = draw(st.sampled_from(list(Suit)))
-        return Card(rank, suit)
+        return _CARD_ST
 
     @st.composite
     def hand_strategy(draw, min_cards=2, max_cards=5):
         """Generate a random hand."""
-        cards = draw(st.lists(card_strategy(), min_size=min_cards, max_size=max_cards))
+        cards = draw(st.lists(_CARD_ST, min_size=min_cards, max_size=max_cards))
         hand = Hand()
         for card in cards:
             hand.add_card(card)
@@ -3,7 +3,7 @@
 import pytest
 from random import Random
 
-from core.cards import Card, Deck, Shoe, Rank, Suit
+from core.cards import Card, Deck, Shoe, Rank, Suit, decode_cards, encode_cards
 
 
 class TestCard:
@@ -77,6 +77,22 @@ class TestCard:
         cards = {card1, card2}
         assert len(cards) == 1
 
+    def test_decoded_cards_are_shared_instances(self):
+        """Test that parsing and decoding reuse one instance per rank and suit."""
+        card = Card.from_string("AS")
+        assert card == Card(Rank.ACE, Suit.SPADES)
+        assert Card.from_string("A♠") is card
+        assert decode_cards(encode_cards([card]))[0] is card
+        assert Card.from_string("KS") is not card
+
+    def test_card_codes_roundtrip(self):
+        """Test that every card survives encoding to one byte and back."""
+        cards = list(Deck())
+        codes = encode_cards(cards)
+        assert len(codes) == 52
+        assert len(set(codes)) == 52
+        assert decode_cards(codes) == cards
+
 
 class TestDeck:
     """Tests for the Deck class."""
@@ -223,3 +239,18 @@ class TestShoe:
         shoe.draw()
         shoe.draw()
         assert shoe.cards_dealt == 3
+
+    def test_shoe_card_codes_roundtrip(self):
+        """Test restoring a shoe from its card codes keeps the draw order."""
+        shoe = Shoe(num_decks=2, rng=Random(7))
+        shoe.shuffle()
+        restored = Shoe(num_decks=2)
+        restored.restore_card_codes(shoe.card_codes)
+
+        assert [restored.draw() for _ in range(104)] == [shoe.draw() for _ in range(104)]
+
+    def test_shoe_restore_invalid_codes_raises(self):
+        """Test that restoring unknown card codes raises an error."""
+        shoe = Shoe(num_decks=1)
+        with pytest.raises(ValueError):
+            shoe.restore_card_codes(bytes([0, 1, 2]))
@@ -172,6 +172,31 @@ class TestOmega2:
         omega2.count_card(Card(Rank.ACE, Suit.HEARTS))
         assert omega2.aces_seen == 2
 
+    def test_ace_side_count_batch(self, omega2, deck):
+        """Test that batch counting also tracks aces."""
+        omega2.count_cards(list(deck))
+        assert omega2.aces_seen == 4
+        assert omega2.running_count == 0
+
+    def test_batch_uses_overridden_count_card(self, deck):
+        """Test that count_cards honours a subclass's count_card override."""
+
+        class TrackingHiLo(HiLoSystem):
+            def __init__(self) -> None:
+                super().__init__()
+                self.counted: list[Card] = []
+
+            def count_card(self, card: Card) -> float:
+                self.counted.append(card)
+                return super().count_card(card)
+
+        system = TrackingHiLo()
+        cards = list(deck)
+        system.count_cards(cards)
+        assert system.counted == cards
+        assert system.cards_seen == 52
+        assert system.running_count == 0
+
     def test_aces_remaining(self, omega2):
         """Test aces remaining calculation."""
         num_decks = 6
@@ -115,6 +115,13 @@ class TestHouseEdgeCalculator:
 
         assert edge_1 < edge_6
 
+    def test_calculate_cached_per_rule_set(self):
+        """Test equal rule sets share one cached edge computation."""
+        edge_a = HouseEdgeCalculator(RuleSet(num_decks=2)).calculate()
+        edge_b = HouseEdgeCalculator(RuleSet(num_decks=2)).calculate()
+
+        assert edge_a is edge_b
+
     def test_player_advantage_with_count(self):
         """Test player advantage calculation with true count."""
         rules = RuleSet()
@@ -3,7 +3,22 @@
 import pytest
 
 from core.strategy import BasicStrategy, Action, RuleSet
-from core.strategy.deviations import ILLUSTRIOUS_18, FAB_4, find_deviation
+from core.strategy.deviations import (
+    ILLUSTRIOUS_18,
+    FAB_4,
+    find_deviation,
+    get_fab_4,
+    get_illustrious,
+)
+
+
+def _action_grid(strategy, totals, upcards, **kwargs):
+    """Map (player_total, dealer_upcard) to the strategy's action."""
+    return {
+        (total, dealer_up): strategy.get_action(total, dealer_up, **kwargs)
+        for total in totals
+        for dealer_up in upcards
+    }
 
 
 class TestBasicStrategy:
@@ -11,91 +26,54 @@ class TestBasicStrategy:
 
     def test_hard_17_always_stand(self, basic_strategy):
         """Test that hard 17+ always stands."""
-        for total in range(17, 22):
-            for dealer_up in range(2, 12):
-                action = basic_strategy.get_action(
-                    player_total=total,
-                    dealer_upcard=dealer_up,
-                    is_soft=False,
-                )
-                assert action == Action.STAND
+        grid = _action_grid(basic_strategy, range(17, 22), range(2, 12))
+        assert grid == dict.fromkeys(grid, Action.STAND)
 
     def test_hard_11_always_double(self, basic_strategy):
         """Test that hard 11 always doubles."""
-        for dealer_up in range(2, 12):
-            action = basic_strategy.get_action(
-                player_total=11,
-                dealer_upcard=dealer_up,
-                is_soft=False,
-            )
-            assert action == Action.DOUBLE
+        grid = _action_grid(basic_strategy, [11], range(2, 12))
+        assert grid == dict.fromkeys(grid, Action.DOUBLE)
 
     def test_hard_8_always_hit(self, basic_strategy):
         """Test that hard 8 or less always hits."""
-        for total in range(5, 9):
-            for dealer_up in range(2, 12):
-                action = basic_strategy.get_action(
-                    player_total=total,
-                    dealer_upcard=dealer_up,
-                    is_soft=False,
-                )
-                assert action == Action.HIT
+        grid = _action_grid(basic_strategy, range(5, 9), range(2, 12))
+        assert grid == dict.fromkeys(grid, Action.HIT)
 
     def test_soft_20_always_stand(self, basic_strategy):
         """Test that soft 20 (A-9) always stands."""
-        for dealer_up in range(2, 12):
-            action = basic_strategy.get_action(
-                player_total=20,
-                dealer_upcard=dealer_up,
-                is_soft=True,
-            )
-            assert action == Action.STAND
+        grid = _action_grid(basic_strategy, [20], range(2, 12), is_soft=True)
+        assert grid == dict.fromkeys(grid, Action.STAND)
 
     def test_pair_aces_always_split(self, basic_strategy):
         """Test that pair of Aces always splits."""
-        for dealer_up in range(2, 12):
-            action = basic_strategy.get_action(
-                player_total=22,  # A-A = 12 soft, but pair_rank is key
-                dealer_upcard=dealer_up,
-                is_pair=True,
-                pair_rank=11,  # Ace value
-            )
-            assert action == Action.SPLIT
+        # A-A = 12 soft, but pair_rank (11 = Ace) is the key
+        grid = _action_grid(
+            basic_strategy, [22], range(2, 12), is_pair=True, pair_rank=11
+        )
+        assert grid == dict.fromkeys(grid, Action.SPLIT)
 
     def test_pair_8s_always_split(self, basic_strategy):
         """Test that pair of 8s always splits."""
-        for dealer_up in range(2, 12):
-            action = basic_strategy.get_action(
-                player_total=16,
-                dealer_upcard=dealer_up,
-                is_pair=True,
-                pair_rank=8,
-            )
-            # Note: might surrender vs 10/A with certain rules
-            assert action in [Action.SPLIT, Action.SURRENDER]
+        grid = _action_grid(
+            basic_strategy, [16], range(2, 12), is_pair=True, pair_rank=8
+        )
+        # Note: might surrender vs 10/A with certain rules
+        assert set(grid.values()) <= {Action.SPLIT, Action.SURRENDER}, grid
 
     def test_pair_10s_never_split(self, basic_strategy):
         """Test that pair of 10s never splits."""
-        for dealer_up in range(2, 12):
-            action = basic_strategy.get_action(
-                player_total=20,
-                dealer_upcard=dealer_up,
-                is_pair=True,
-                pair_rank=10,
-            )
-            assert action == Action.STAND
+        grid = _action_grid(
+            basic_strategy, [20], range(2, 12), is_pair=True, pair_rank=10
+        )
+        assert grid == dict.fromkeys(grid, Action.STAND)
 
     def test_pair_5s_never_split(self, basic_strategy):
         """Test that pair of 5s never splits (treat as 10)."""
-        for dealer_up in range(2, 12):
-            action = basic_strategy.get_action(
-                player_total=10,
-                dealer_upcard=dealer_up,
-                is_pair=True,
-                pair_rank=5,
-            )
-            # Should double, not split
-            assert action in [Action.DOUBLE, Action.HIT]
+        grid = _action_grid(
+            basic_strategy, [10], range(2, 12), is_pair=True, pair_rank=5
+        )
+        # Should double, not split
+        assert set(grid.values()) <= {Action.DOUBLE, Action.HIT}, grid
 
     def test_conditional_double(self, basic_strategy):
         """Test conditional double resolution."""
@@ -118,18 +96,12 @@ class TestBasicStrategy:
 
     def test_hard_12_vs_dealer(self, basic_strategy):
         """Test hard 12 strategy."""
-        # 12 vs 2-3: Hit
-        assert basic_strategy.get_action(12, 2, is_soft=False) == Action.HIT
-        assert basic_strategy.get_action(12, 3, is_soft=False) == Action.HIT
-
-        # 12 vs 4-6: Stand
-        assert basic_strategy.get_action(12, 4, is_soft=False) == Action.STAND
-        assert basic_strategy.get_action(12, 5, is_soft=False) == Action.STAND
-        assert basic_strategy.get_action(12, 6, is_soft=False) == Action.STAND
-
-        # 12 vs 7+: Hit
-        for dealer in range(7, 12):
-            assert basic_strategy.get_action(12, dealer, is_soft=False) == Action.HIT
+        # 12 vs 2-3: Hit, 12 vs 4-6: Stand, 12 vs 7+: Hit
+        expected = {
+            (12, dealer): Action.STAND if 4 <= dealer <= 6 else Action.HIT
+            for dealer in range(2, 12)
+        }
+        assert _action_grid(basic_strategy, [12], range(2, 12)) == expected
 
     def test_surrender_16_vs_10(self):
         """Test surrender with 16 vs 10."""
@@ -170,12 +142,13 @@ class TestIllustrious18:
         assert insurance.should_deviate(3.0)
         assert insurance.should_deviate(4.0)
 
+    def test_get_illustrious_missing_hand(self):
+        """Test lookup of a hand with no Illustrious 18 play."""
+        assert get_illustrious(17, 10) is None
+
     def test_16_vs_10_deviation(self):
         """Test 16 vs 10: Stand at TC 0+."""
-        deviation = next(
-            d for d in ILLUSTRIOUS_18
-            if d.player_total == 16 and d.dealer_upcard == 10 and not d.is_pair
-        )
+        deviation = get_illustrious(16, 10)
         assert deviation.index == 0.0
         assert deviation.basic_action == Action.HIT
         assert deviation.deviation_action == Action.STAND
@@ -186,10 +159,7 @@ class TestIllustrious18:
 
     def test_12_vs_2_deviation(self):
         """Test 12 vs 2: Stand at TC +3."""
-        deviation = next(
-            d for d in ILLUSTRIOUS_18
-            if d.player_total == 12 and d.dealer_upcard == 2
-        )
+        deviation = get_illustrious(12, 2)
         assert deviation.index == 3.0
         assert deviation.basic_action == Action.HIT
         assert deviation.deviation_action == Action.STAND
@@ -197,10 +167,7 @@ class TestIllustrious18:
     def test_negative_index_deviation(self):
         """Test negative index (hit at low count)."""
         # 13 vs 2: Hit at TC -1 or below
-        deviation = next(
-            d for d in ILLUSTRIOUS_18
-            if d.player_total == 13 and d.dealer_upcard == 2
-        )
+        deviation = get_illustrious(13, 2)
         assert deviation.index == -1.0
         assert deviation.direction == "at_or_below"
         assert deviation.basic_action == Action.STAND
@@ -220,19 +187,13 @@ class TestFab4:
 
     def test_14_vs_10_surrender(self):
         """Test 14 vs 10: Surrender at TC +3."""
-        deviation = next(
-            d for d in FAB_4
-            if d.player_total == 14 and d.dealer_upcard == 10
-        )
+        deviation = get_fab_4(14, 10)
         assert deviation.index == 3.0
         assert deviation.deviation_action == Action.SURRENDER
 
     def test_15_vs_9_surrender(self):
         """Test 15 vs 9: Surrender at TC +2."""
-        deviation = next(
-            d for d in FAB_4
-            if d.player_total == 15 and d.dealer_upcard == 9
-        )
+        deviation = get_fab_4(15, 9)
         assert deviation.index == 2.0
         assert deviation.deviation_action == Action.SURRENDER
 
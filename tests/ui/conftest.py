@@ -1,30 +1,83 @@
 """Pytest fixtures for UI tests."""
 
+import os
+import socket
 import subprocess
 import time
+import urllib.error
+import urllib.request
 
 import pytest
 from playwright.sync_api import Page
 
+BASE_PORT = 8765
+
+
+@pytest.fixture(scope="session")
+def server_port() -> int:
+    """Port for this xdist worker's server (gw0 -> 8765, gw1 -> 8766, ...).
+
+    Read from the environment rather than xdist's worker_id fixture, so the
+    suite also runs with xdist disabled.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return BASE_PORT + int(worker[2:])
+
 
 @pytest.fixture(scope="session")
-def server():
-    """Start the FastAPI server for UI tests."""
+def server(server_port: int):
+    """Start a FastAPI server for this worker's UI tests."""
+    url = f"http://localhost:{server_port}"
+    if _port_in_use(server_port):
+        raise RuntimeError(f"Port {server_port} is already in use")
     proc = subprocess.Popen(
-        ["uvicorn", "api.main:app", "--port", "8765"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        ["uvicorn", "api.main:app", "--port", str(server_port)],
+        # Nothing reads the server's output; a pipe would eventually fill
+        # and block the server on its next log write
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    time.sleep(2)  # Wait for server startup
+    try:
+        _wait_for_server(url, proc)
+    except BaseException:
+        proc.terminate()
+        proc.wait()
+        raise
     yield proc
     proc.terminate()
     proc.wait()
 
 
+def _port_in_use(port: int) -> bool:
+    """Check whether something already accepts connections on the port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex(("localhost", port)) == 0
+
+
+def _wait_for_server(
+    url: str, proc: subprocess.Popen[bytes], timeout: float = 10.0
+) -> None:
+    """Poll the server until it answers, instead of sleeping a fixed time."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Test server exited with code {proc.returncode}")
+        try:
+            urllib.request.urlopen(url, timeout=0.5).close()
+            return
+        except urllib.error.HTTPError:
+            # Any HTTP response, even an error status, means it is serving
+            return
+        except (urllib.error.URLError, ConnectionError):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Test server did not start at {url}")
+            time.sleep(0.05)
+
+
 @pytest.fixture
-def base_url():
-    """Base URL for the test server."""
-    return "http://localhost:8765"
+def base_url(server_port: int):
+    """Base URL for this worker's test server."""
+    return f"http://localhost:{server_port}"
 
 
 @pytest.fixture
@@ -24,10 +24,6 @@ class TestCountingDrill:
         expect(drill_page.locator("#drill-system")).to_be_visible()
         expect(drill_page.locator("#drill-speed")).to_be_visible()
 
-    def test_default_num_cards(self, drill_page: Page):
-        """Test default number of cards."""
-        expect(drill_page.locator("#drill-num-cards")).to_have_value("10")
-
     def test_default_system_hilo(self, drill_page: Page):
         """Test default counting system is Hi-Lo."""
         expect(drill_page.locator("#drill-system")).to_have_value("hilo")
@@ -41,33 +37,32 @@ class TestCountingDrill:
         """Test start drill button is visible."""
         expect(drill_page.locator("#btn-start-drill")).to_be_visible()
 
-    def test_start_drill_shows_cards(self, drill_page: Page):
-        """Test starting drill shows cards."""
+    @pytest.fixture
+    def started_drill(self, drill_page: Page):
+        """A counting drill that has finished flashing its cards."""
         drill_page.fill("#drill-num-cards", "3")
-        drill_page.fill("#drill-speed", "500")
+        # 1 ms per card; the input's min only limits the spinner, and 0 would
+        # fall back to the default speed
+        drill_page.fill("#drill-speed", "1")
         drill_page.click("#btn-start-drill")
-        # Wait for drill to complete and input to appear
         drill_page.wait_for_selector("#drill-input-area:not(.hidden)", timeout=10000)
-        expect(drill_page.locator("#drill-input-area")).to_be_visible()
+        return drill_page
+
+    def test_start_drill_shows_cards(self, started_drill: Page):
+        """Test starting drill shows cards."""
+        expect(started_drill.locator("#drill-input-area")).to_be_visible()
 
-    def test_count_input_appears_after_drill(self, drill_page: Page):
+    def test_count_input_appears_after_drill(self, started_drill: Page):
         """Test count input appears after cards are shown."""
-        drill_page.fill("#drill-num-cards", "3")
-        drill_page.fill("#drill-speed", "500")
-        drill_page.click("#btn-start-drill")
-        drill_page.wait_for_selector("#user-count:not([disabled])", timeout=10000)
-        expect(drill_page.locator("#user-count")).to_be_visible()
+        expect(started_drill.locator("#user-count")).to_be_visible()
+        expect(started_drill.locator("#user-count")).to_be_enabled()
 
-    def test_submit_count(self, drill_page: Page):
+    def test_submit_count(self, started_drill: Page):
         """Test submitting count shows result."""
-        drill_page.fill("#drill-num-cards", "3")
-        drill_page.fill("#drill-speed", "500")
-        drill_page.click("#btn-start-drill")
-        drill_page.wait_for_selector("#drill-input-area:not(.hidden)", timeout=10000)
-        drill_page.fill("#user-count", "0")
-        drill_page.click("#drill-input-area button")
-        drill_page.wait_for_selector("#drill-result:not(.hidden)", timeout=5000)
-        expect(drill_page.locator("#drill-result")).to_be_visible()
+        started_drill.fill("#user-count", "0")
+        started_drill.click("#drill-input-area button")
+        started_drill.wait_for_selector("#drill-result:not(.hidden)", timeout=5000)
+        expect(started_drill.locator("#drill-result")).to_be_visible()
 
 
 class TestStrategyDrill:
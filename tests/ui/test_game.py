@@ -35,19 +35,6 @@ class TestNavigation:
 class TestBetting:
     """Tests for betting controls."""
 
-    def test_bet_input_visible(self, game_page: Page):
-        """Test that bet input is visible."""
-        expect(game_page.locator("#bet-amount")).to_be_visible()
-
-    def test_bet_input_default_value(self, game_page: Page):
-        """Test default bet amount."""
-        bet_input = game_page.locator("#bet-amount")
-        expect(bet_input).to_have_value("10")
-
-    def test_bet_button_visible(self, game_page: Page):
-        """Test that bet button is visible."""
-        expect(game_page.locator("#btn-bet")).to_be_visible()
-
     def test_change_bet_amount(self, game_page: Page):
         """Test changing bet amount."""
         bet_input = game_page.locator("#bet-amount")
@@ -58,8 +45,7 @@ class TestBetting:
         """Test placing a bet starts the game."""
         game_page.click("#btn-bet")
         # After betting, action controls should become visible
-        game_page.wait_for_selector("#action-controls:not(.hidden)", timeout=5000)
-        expect(game_page.locator("#action-controls")).to_be_visible()
+        expect(game_page.locator("#action-controls:not(.hidden)")).to_be_visible(timeout=5000)
 
 
 class TestGameActions:
@@ -96,8 +82,8 @@ class TestGameActions:
         """Test standing ends player turn."""
         active_game_page.click("#btn-stand")
         # After standing, game should resolve and show result
-        active_game_page.wait_for_selector("#result-controls:not(.hidden)", timeout=5000)
-        expect(active_game_page.locator("#result-controls")).to_be_visible()
+        result_controls = active_game_page.locator("#result-controls:not(.hidden)")
+        expect(result_controls).to_be_visible(timeout=5000)
 
 
 class TestKeyboardShortcuts:
@@ -113,22 +99,19 @@ class TestKeyboardShortcuts:
     def test_b_key_places_bet(self, game_page: Page):
         """Test B key places bet."""
         game_page.keyboard.press("b")
-        game_page.wait_for_selector("#action-controls:not(.hidden)", timeout=5000)
-        expect(game_page.locator("#action-controls")).to_be_visible()
+        expect(game_page.locator("#action-controls:not(.hidden)")).to_be_visible(timeout=5000)
 
     def test_s_key_stands(self, active_game_page: Page):
         """Test S key stands."""
         active_game_page.keyboard.press("s")
-        active_game_page.wait_for_selector("#result-controls:not(.hidden)", timeout=5000)
-        expect(active_game_page.locator("#result-controls")).to_be_visible()
+        result_controls = active_game_page.locator("#result-controls:not(.hidden)")
+        expect(result_controls).to_be_visible(timeout=5000)
 
     def test_h_key_hits(self, active_game_page: Page):
         """Test H key hits."""
         initial_cards = active_game_page.locator("#hand-0 .cards .card").count()
         active_game_page.keyboard.press("h")
         # Either more cards or game ended
-        active_game_page.wait_for_function(
-            f"document.querySelectorAll('#hand-0 .cards .card').length > {initial_cards} || "
-            "!document.querySelector('#result-controls').classList.contains('hidden')",
-            timeout=5000,
-        )
+        new_card = active_game_page.locator("#hand-0 .cards .card").nth(initial_cards)
+        round_over = active_game_page.locator("#result-controls:not(.hidden)")
+        expect(new_card.or_(round_over).first).to_be_attached(timeout=5000)